@@ -6,6 +6,7 @@ from .error import InvalidToken, PageNotFound, BeingRateLimited, \
 from .objects import create_club, create_image, BASE_SITE, create_post, create_video, create_board, create_user, \
     create_notification, create_comment
 from functools import wraps
+from importlib import import_module
 from asyncio import iscoroutinefunction
 
 __title__ = 'UCube'
@@ -13,32 +14,45 @@ __author__ = 'MujyKun'
 __license__ = 'MIT'
 __version__ = '0.0.2.2'
 
+__all__ = [
+    "models", "InvalidToken", "PageNotFound", "BeingRateLimited", "SomethingWentWrong", "InvalidCredentials",
+    "LoginFailed", "NoHookFound", "create_club", "create_image", "BASE_SITE", "create_post", "create_video",
+    "create_board", "create_user", "create_notification", "create_comment", "check_expired_token", "UCubeClient",
+    "UCubeClientSync", "UCubeClientAsync"
+]
+
+# the clients pull in their web libraries, so they are only imported once they are first accessed.
+_client_modules = {
+    "UCubeClient": ".ucubeclient",
+    "UCubeClientSync": ".ucubesync",
+    "UCubeClientAsync": ".ucubeasync",
+}
+
 
 def check_expired_token(func):
     """Decorator to reinstate a token if it is expired."""
 
-    @wraps(func)
-    async def wrap_async_function(self=None, *args, **kwargs):
-        if self.expired_token:
-            if self._refresh_token_exists:
-                await self._refresh_token()
-            else:
-                await self._try_login()
-                await self._wait_for_login()  # wait for login or an exception to occur.
-
-        return await func(self, *args, **kwargs)
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def wrap_async_function(self=None, *args, **kwargs):
+            if self.expired_token:
+                await self._reinstate_token()
+            return await func(self, *args, **kwargs)
+        return wrap_async_function
 
     @wraps(func)
     def wrap_sync_function(self=None, *args, **kwargs):
         if self.expired_token:
-            if self._refresh_token_exists:
-                self._refresh_token()
-            else:
-                self._try_login()
+            self._reinstate_token()
         return func(self, *args, **kwargs)
-    return wrap_sync_function if not iscoroutinefunction(func) else wrap_async_function
+    return wrap_sync_function
+
 
+def __getattr__(name):
+    module_name = _client_modules.get(name)
+    if not module_name:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .ucubeclient import UCubeClient
-from .ucubesync import UCubeClientSync
-from .ucubeasync import UCubeClientAsync
+    client = getattr(import_module(module_name, __name__), name)
+    globals()[name] = client  # skip this lookup on the next access.
+    return client
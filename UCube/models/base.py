@@ -1,5 +1,15 @@
 import re
-from typing import Optional
+from functools import lru_cache
+from sys import intern
+from typing import Iterable, Optional
+
+# new line tags are captured so they can be swapped for a new line while every other tag/entity is removed.
+_HTML_PROBE = re.compile(r'[<&]')
+_HTML_CLEANER = re.compile(r'(<br\s*/?>)|<[^>\n]*>|&(?:[a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});', re.ASCII)
+
+
+def _replace_html(match) -> str:
+    return "\n" if match.group(1) else ""
 
 
 class BaseModel:
@@ -16,6 +26,10 @@ class BaseModel:
 
             Checks if two models do not have the same slug.
 
+        .. describe:: hash(x)
+
+            Returns the hash of the model's slug.
+
         .. describe:: str(x)
 
             Returns the model's name.
@@ -37,19 +51,60 @@ class BaseModel:
     name: Optional[:class:`str`]
         The name of the object.
     """
+    __slots__ = ('slug', 'name')
+
     def __init__(self, slug: str, name: str = None):
-        self.slug: str = slug
+        self.slug: str = self._intern(slug)
         self.name: Optional[str] = name
 
     def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            return NotImplemented
         return self.slug == other.slug
 
-    def __ne__(self, other):
-        return not self == other
+    def __hash__(self):
+        return hash(self.slug)
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_raw_list(cls, raw_list: Iterable[dict], base_url: str = None, **kwargs) -> list:
+        """
+        Create a model for every raw object in a list.
+
+        Parameters
+        ----------
+        raw_list: Iterable[:class:`dict`]
+            The raw objects directly from a UCube API endpoint.
+        base_url: Optional[:class:`str`]
+            The Base URL of the site. Only passed to the models if given, since only some models use it.
+        kwargs:
+            Any extra arguments to pass to every model.
+
+        Returns
+        -------
+        A list of the models in the same order.: List[:class:`BaseModel`]
+        """
+        if base_url is not None:
+            kwargs["base_url"] = base_url
+        return [cls(**raw, **kwargs) for raw in raw_list]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_factory(name: str):
+        """Get one of the default ``create_*`` methods from :mod:`UCube.objects`.
+
+        This is imported when it is needed since :mod:`UCube.objects` imports the models.
+        """
+        from .. import objects
+        return getattr(objects, name)
+
+    @staticmethod
+    def _intern(slug: Optional[str]) -> Optional[str]:
+        """Intern a slug since the same slugs are repeated as keys and references across the cache."""
+        return intern(slug) if isinstance(slug, str) else slug
+
     @staticmethod
     def remove_html(content: str) -> str:
         """
@@ -67,7 +122,8 @@ class BaseModel:
         if not content:
             return ""
 
-        content = content.replace("<br>", "\n")  # replace new line tags before they get replaced.
-        html_cleaner = re.compile('<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});')
-        clean_text = re.sub(html_cleaner, '', content)
-        return clean_text
+        if not _HTML_PROBE.search(content):
+            # plain text does not need to go through the regex.
+            return content
+
+        return _HTML_CLEANER.sub(_replace_html, content)
@@ -1,4 +1,4 @@
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 
 
 from . import BaseModel
@@ -51,8 +51,23 @@ class Board(BaseModel):
     posts: Dict[:class:`str`, :class:`Post`]
 
     """
-    def __init__(self, **options):
-        super().__init__(options.get("slug"), options.get("name"))
-        self.active_flag: bool = options.get("active_flag")
-        self.club_slug: str = options.get("club_slug")
-        self.posts: Dict[str, Post] = {}
+    __slots__ = ('active_flag', 'club_slug', '_posts')
+
+    def __init__(self, slug: str = None, name: str = None, active_flag: bool = None, club_slug: str = None,
+                 **options):
+        super().__init__(slug, name)
+        self.active_flag: bool = active_flag
+        self.club_slug: str = self._intern(club_slug)
+        # created on first access since most boards never have their posts loaded.
+        self._posts: Optional[Dict[str, Post]] = None
+
+    @property
+    def posts(self) -> Dict[str, 'Post']:
+        """A Dict of Posts that belong to the Board with the slug as the key."""
+        if self._posts is None:
+            self._posts = {}
+        return self._posts
+
+    @posts.setter
+    def posts(self, posts: Dict[str, 'Post']):
+        self._posts = posts
@@ -40,8 +40,8 @@ class Club(BaseModel):
         The unique identifier of the Club.
     artist_name: :class:`str`
         The artist's name. Could also be a group.
-    create_image: :class:`UCube.create_image`
-        The method to call for creating an image.
+    create_image: Optional[:class:`UCube.create_image`]
+        The method to call for creating an image. Defaults to :class:`UCube.create_image`.
 
     Other Parameters
     ----------------
@@ -84,24 +84,47 @@ class Club(BaseModel):
         A list of Notifications that belong to the Club.
 
     """
-    def __init__(self, artist_name: str, create_image, **options):
-        super().__init__(options.get("slug"), artist_name)
-        self.artist_name: str = artist_name
-        self.color_one: Optional[str] = options.pop("color_1", None)
-        self.color_two: Optional[str] = options.pop("color_2", None)
-
-        artist_logo = options.get("artist_logo_file")
-        self.artist_logo: Optional[Image] = None if not artist_logo else create_image(artist_logo)
-
-        thumbnail_image = options.get("thumbnail_file")
-        self.thumbnail: Optional[Image] = None if not thumbnail_image else create_image(thumbnail_image)
+    __slots__ = ('artist_name', 'color_one', 'color_two', 'artist_logo', 'thumbnail', 'small_thumbnail', 'external_url',
+                 'registered_time', '_boards', '_notifications')
 
-        small_thumbnail_image = options.get("thumbnail_small_file")
-        self.small_thumbnail: Optional[Image] = None if not small_thumbnail_image else \
-            create_image(small_thumbnail_image)
-
-        self.external_url: str = options.pop("external_url", None)
-        self.registered_time: str = options.pop("register_datetime", None)
-
-        self.boards: Dict[str, Board] = {}
-        self.notifications: List[Notification] = []
+    def __init__(self, artist_name: str, create_image=None, slug: str = None, color_1: str = None, color_2: str = None,
+                 artist_logo_file: dict = None, thumbnail_file: dict = None, thumbnail_small_file: dict = None,
+                 external_url: str = None, register_datetime: str = None, **options):
+        super().__init__(slug, artist_name)
+        self.artist_name: str = artist_name
+        self.color_one: Optional[str] = color_1
+        self.color_two: Optional[str] = color_2
+
+        create_image = create_image or self._get_factory("create_image")
+        self.artist_logo: Optional[Image] = create_image(artist_logo_file) if artist_logo_file else None
+        self.thumbnail: Optional[Image] = create_image(thumbnail_file) if thumbnail_file else None
+        self.small_thumbnail: Optional[Image] = create_image(thumbnail_small_file) if thumbnail_small_file else None
+
+        self.external_url: str = external_url
+        self.registered_time: str = register_datetime
+
+        # created on first access since they are left empty unless the client loads them.
+        self._boards: Optional[Dict[str, Board]] = None
+        self._notifications: Optional[List[Notification]] = None
+
+    @property
+    def boards(self) -> Dict[str, 'Board']:
+        """A Dict of Boards that belong to the Club with the slug as the key."""
+        if self._boards is None:
+            self._boards = {}
+        return self._boards
+
+    @boards.setter
+    def boards(self, boards: Dict[str, 'Board']):
+        self._boards = boards
+
+    @property
+    def notifications(self) -> List['Notification']:
+        """A list of Notifications that belong to the Club."""
+        if self._notifications is None:
+            self._notifications = []
+        return self._notifications
+
+    @notifications.setter
+    def notifications(self, notifications: List['Notification']):
+        self._notifications = notifications
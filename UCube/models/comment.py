@@ -35,8 +35,9 @@ class Comment(BaseModel):
     ----------
     uid:
         The unique identifier (basically a Slug) of the Comment.
-    create_user: :class:`UCube.create_user`
+    create_user: Optional[:class:`UCube.create_user`]
         The method to call for creating a user. You can also use a custom method.
+        Defaults to :class:`UCube.create_user`.
 
     Attributes
     ----------
@@ -51,15 +52,17 @@ class Comment(BaseModel):
     user: Optional[:class:`User`]
         The User that created the comment.
     """
-    def __init__(self, uid, create_user, **options):
+    __slots__ = ('comment_count', 'content', 'parent_slug', 'created_at', 'user')
+
+    def __init__(self, uid, create_user=None, comment_count: int = None, content: str = None, parent_uid=None,
+                 register_datetime: str = None, registrant: dict = None, **options):
         super().__init__(str(uid))
-        self.comment_count: int = options.pop("comment_count", None)
-        self.content: str = options.pop("content", None)
-        parent_slug = options.get("parent_uid")
-        self.parent_slug: str = None if not parent_slug else str(parent_slug)
-        self.created_at: str = options.pop("register_datetime", None)
-        user = options.pop("registrant", None)
-        self.user: Optional[User] = None if not user else create_user(user)
+        self.comment_count: int = comment_count
+        self.content: str = content
+        self.parent_slug: str = self._intern(str(parent_uid)) if parent_uid else None
+        self.created_at: str = register_datetime
+        create_user = create_user or self._get_factory("create_user")
+        self.user: Optional[User] = create_user(registrant) if registrant else None
 
     def __str__(self):
         return self.content
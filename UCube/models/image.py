@@ -64,9 +64,11 @@ class Image(BaseModel):
     height: :class:`int`
         The height of the Image. This may be set to 0 at times.
     """
+    __slots__ = ('path', 'size', 'width', 'height')
+
     def __init__(self, path, base_url, **options):
-        if "https://" not in path:
-            path = base_url + path
+        if not path.startswith(("https://", "http://")):
+            path = f"{base_url}{path}"
         if not options.get("slug"):
             # The slug will become the path if it does not exist.
             options["slug"] = path
@@ -86,10 +88,5 @@ class Image(BaseModel):
         :param url: :class:`str`
             The URL of the photo.
         """
-        last_slash_pos = url.rfind("/")
-        if last_slash_pos == -1:
-            return None
-        elif last_slash_pos == len(url) - 1:
-            return self.__extract_photo_name(url[0:len(url) - 1])
-        else:
-            return url[last_slash_pos + 1: len(url)]
+        _, slash, photo_name = url.rstrip("/").rpartition("/")
+        return photo_name if slash else None
@@ -1,5 +1,8 @@
 from . import BaseModel
 
+# shared fallback for notifications without data. It is only ever read from.
+_EMPTY_DATA: dict = {}
+
 
 class Notification(BaseModel):
     r"""
@@ -61,18 +64,22 @@ class Notification(BaseModel):
 
 
     """
-    def __init__(self, uid, **options):
-        super().__init__(str(uid), options.get("title"))
-        self.body: str = options.pop("body", None)
-        self.topic_slug: str = options.pop("topic", None)
-        self.channel_type: str = options.pop("channel", None)  # usually "notification"
-        self.created_at: str = options.pop("register_datetime", None)
-        data = options.get("data") or {}
-        self.direct_link = data.pop("link", None)
-        self.data_type = data.pop("type", None)  # usually "notification"
-        self.club_name = data.pop("club_name", None)
-        self.club_slug = data.pop("club_slug", None)
-        self.post_slug = data.pop("post_slug", None)
-        self.board_name = data.pop("board_name", None)
-        self.board_slug = data.pop("board_slug", None)
-        self.board_type = data.pop("board_type", None)
+    __slots__ = ('body', 'topic_slug', 'channel_type', 'created_at', 'direct_link', 'data_type', 'club_name',
+                 'club_slug', 'post_slug', 'board_name', 'board_slug', 'board_type')
+
+    def __init__(self, uid, title: str = None, body: str = None, topic: str = None, channel: str = None,
+                 register_datetime: str = None, data: dict = None, **options):
+        super().__init__(str(uid), title)
+        self.body: str = body
+        self.topic_slug: str = self._intern(topic)
+        self.channel_type: str = channel  # usually "notification"
+        self.created_at: str = register_datetime
+        data = data or _EMPTY_DATA
+        self.direct_link = data.get("link")
+        self.data_type = data.get("type")  # usually "notification"
+        self.club_name = data.get("club_name")
+        self.club_slug = self._intern(data.get("club_slug"))
+        self.post_slug = self._intern(data.get("post_slug"))
+        self.board_name = data.get("board_name")
+        self.board_slug = self._intern(data.get("board_slug"))
+        self.board_type = data.get("board_type")
@@ -38,12 +38,17 @@ class Post(BaseModel):
     ----------
     slug: :class:`str`
         The unique identifier of the Post.
-    create_image: :class:`UCube.create_image`
+    create_image: Optional[:class:`UCube.create_image`]
         The method to call for creating an image. You can also use a custom method.
-    create_video: :class:`UCube.create_video`
+        A custom method is passed the raw image with the ``base_url`` added to it.
+        Defaults to :class:`UCube.create_image`.
+    create_video: Optional[:class:`UCube.create_video`]
         The method to call for creating a video. You can also use a custom method.
-    create_user: :class:`UCube.create_user`
+        A custom method is passed the raw video with the ``base_url`` added to it.
+        Defaults to :class:`UCube.create_video`.
+    create_user: Optional[:class:`UCube.create_user`]
         The method to call for creating a user. You can also use a custom method.
+        Defaults to :class:`UCube.create_user`.
     content: :class:`str`
         The body content of the post with HTML.
     board_slug: :class:`str`
@@ -75,28 +80,38 @@ class Post(BaseModel):
     comments: List[:class:`Comment`]
         A list of comments that belong to the Post.
     """
-    def __init__(self, create_image, create_video, create_user, **options):
-        super().__init__(options.get("slug"), options.get("name"))
-        self.content: str = self.remove_html(options.pop("content", ""))
-
-        self.board_slug: str = options.pop("board_slug", None)
-
-        self.images: List[Image] = []
-        self.videos: List[Video] = []
-
-        media = options.pop("media", [])
-
-        for media_obj in media:
-            media_obj["data"]["base_url"] = options.get("base_url")
-            if media_obj["type_code"] == "601":  # images
-                self.images.append(create_image(media_obj["data"]))
-            elif media_obj["type_code"] == "602":  # videos
-                self.videos.append(create_video(media_obj["data"]))
-
-        self.comment_count: int = options.pop("comment_count", None)
-        self.posted_at = options.pop("register_datetime", None)
-        user = options.pop("registrant", None)
-        self.user: Optional[User] = None if not user else create_user(user)
+    __slots__ = ('content', 'board_slug', 'images', 'videos', 'comment_count', 'posted_at', 'user', 'comments')
+
+    def __init__(self, create_image=None, create_video=None, create_user=None, **options):
+        get_option, pop_option = options.get, options.pop
+        create_user = create_user or self._get_factory("create_user")
+        super().__init__(get_option("slug"), get_option("name"))
+        self.content: str = self.remove_html(pop_option("content", ""))
+
+        self.board_slug: str = self._intern(pop_option("board_slug", None))
+
+        media = pop_option("media", [])
+        base_url = get_option("base_url")
+        raw_images = [media_obj["data"] for media_obj in media if media_obj["type_code"] == "601"]
+        raw_videos = [media_obj["data"] for media_obj in media if media_obj["type_code"] == "602"]
+
+        # custom methods are called with the base url as part of the raw media like they always were.
+        # the raw media is copied instead of changed since it belongs to the response.
+        if create_image:
+            self.images: List[Image] = [create_image({**raw_image, "base_url": base_url}) for raw_image in raw_images]
+        else:
+            create_image = self._get_factory("create_image")
+            self.images: List[Image] = [create_image(raw_image, base_url=base_url) for raw_image in raw_images]
+
+        if create_video:
+            self.videos: List[Video] = [create_video({**raw_video, "base_url": base_url}) for raw_video in raw_videos]
+        else:
+            self.videos: List[Video] = list(map(self._get_factory("create_video"), raw_videos))
+
+        self.comment_count: int = pop_option("comment_count", None)
+        self.posted_at = pop_option("register_datetime", None)
+        user = pop_option("registrant", None)
+        self.user: Optional[User] = create_user(user) if user else None
 
         self.comments: List[Comment] = []
 
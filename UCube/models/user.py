@@ -48,8 +48,9 @@ class User(BaseModel):
 
 
     """
-    def __init__(self, slug: str, base_url: str, **options):
-        super().__init__(slug, options.get("nick_name") or options.get("artist_name"))
-        image = options.pop("profile_path", None)
+    __slots__ = ('profile_image',)
 
-        self.profile_image = None if not image else base_url + image
+    def __init__(self, slug: str, base_url: str, nick_name: str = None, artist_name: str = None,
+                 profile_path: str = None, **options):
+        super().__init__(slug, nick_name or artist_name)
+        self.profile_image: Optional[str] = f"{base_url}{profile_path}" if profile_path else None
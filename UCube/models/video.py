@@ -51,13 +51,11 @@ class Video(BaseModel):
     thumbnail: :class:`str`
         The thumbnail of the video.
     """
-    def __init__(self, url, **options):
-        if not options.get("slug"):
-            # The slug will become the url if it does not exist.
-            options["slug"] = url
-        if options.get("title") and not options.get("name"):
-            options["name"] = options["title"]
-        super().__init__(options.get("slug"), options.get("name"))
+    __slots__ = ('url', 'thumbnail')
+
+    def __init__(self, url, slug: str = None, name: str = None, title: str = None, image: str = None, **options):
+        # The slug will become the url if it does not exist.
+        super().__init__(slug or url, name or title)
 
         self.url: str = url
-        self.thumbnail: Optional[str] = options.pop("image", None)
+        self.thumbnail: Optional[str] = image
@@ -1,6 +1,8 @@
+from sys import intern
+
 from .models import Club, Image, Post, Video, Board, User, Notification, Comment
 
-BASE_SITE = "https://united-cube.com/"
+BASE_SITE = intern("https://united-cube.com/")
 
 
 def create_club(raw_club: dict) -> Club:
@@ -15,7 +17,6 @@ def create_club(raw_club: dict) -> Club:
     -------
     A Club Model: :class:`UCube.models.Club`
     """
-    raw_club["create_image"] = create_image
     return Club(**raw_club)
 
 
@@ -34,21 +35,22 @@ def create_board(raw_board: dict) -> Board:
     return Board(**raw_board)
 
 
-def create_image(raw_image) -> Image:
+def create_image(raw_image, base_url: str = None) -> Image:
     """
 
     Parameters
     ----------
     raw_image: dict
         The raw information about an image directly from a UCube API endpoint.
+    base_url: Optional[str]
+        The Base URL of the image site. Defaults to the UCube site.
 
     Returns
     -------
     An Image Model: :class:`UCube.models.Image`
 
     """
-    raw_image["base_url"] = BASE_SITE
-    return Image(**raw_image)
+    return Image(base_url=base_url or BASE_SITE, **raw_image)
 
 
 def create_video(raw_video) -> Video:
@@ -79,8 +81,7 @@ def create_user(raw_user) -> User:
     -------
     A User Model: :class:`UCube.models.User`
     """
-    raw_user["base_url"] = BASE_SITE
-    return User(**raw_user)
+    return User(base_url=BASE_SITE, **raw_user)
 
 
 def create_notification(raw_notification) -> Notification:
@@ -110,7 +111,6 @@ def create_comment(raw_comment) -> Comment:
     -------
     A Comment Model: :class:`UCube.models.Comment`
     """
-    raw_comment["create_user"] = create_user
     return Comment(**raw_comment)
 
 
@@ -126,8 +126,4 @@ def create_post(raw_post) -> Post:
     -------
     A Post Model: :class:`UCube.models.Post`
     """
-    raw_post["create_image"] = create_image
-    raw_post["create_video"] = create_video
-    raw_post["create_user"] = create_user
-    raw_post["base_url"] = BASE_SITE
-    return Post(**raw_post)
+    return Post(base_url=BASE_SITE, **raw_post)
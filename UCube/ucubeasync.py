@@ -1,23 +1,126 @@
 import asyncio
-from typing import List, Optional
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
-from asyncio import get_event_loop
-from . import UCubeClient, InvalidToken, InvalidCredentials, LoginFailed, create_club, \
-    models, create_post, create_board, create_notification, create_comment, check_expired_token, NoHookFound
+from multidict import CIMultiDict, CIMultiDictProxy
+from .ucubeclient import json_loads, json_dumps, _POLL_INTERVAL, _remember_etag
+from . import UCubeClient, InvalidToken, InvalidCredentials, LoginFailed, BeingRateLimited, create_club, \
+    models, create_post, create_comment, NoHookFound
 
-from random import SystemRandom
-from string import ascii_letters, digits
+try:
+    # ijson is optional, but lets the list endpoints be parsed while they are still being received.
+    import ijson
+except ImportError:
+    ijson = None
+
+from secrets import token_hex
+
+_READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+# the amount of items per page and the amount of pages requested at once when the cache walks every page of a list.
+_PAGE_SIZE = 100
+_PAGE_WINDOW = 5
+
+# the amount of seconds to wait before each retry of a rate-limited request.
+_RATE_LIMIT_DELAYS = (1, 2, 4)
+
+# exceptions that stop the whole process instead of only the request they came from.
+_CRITICAL_EXCEPTIONS = (InvalidToken, InvalidCredentials, LoginFailed, BeingRateLimited)
+
+# the amount of seconds the lists of clubs and boards are reused for since they rarely change.
+_CLUBS_TTL = 300
+_BOARDS_TTL = 60
+
+# the amount of items created from a decoded body before control is given back to the event loop.
+_CREATE_CHUNK_SIZE = 256
+
+# the loop the shared session was created in along with the session, since a session only works in its own loop.
+_shared_session: Optional[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = None
+
+
+def _create_session(limit: int = 64, limit_per_host: int = 32) -> aiohttp.ClientSession:
+    """Create a web session with a connection pool and read buffer sized for UCube."""
+    # every request goes to the same host, so the per host limit is what bounds parallel requests.
+    # connections are kept alive long enough to be reused between checks for new notifications.
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300,
+                                     keepalive_timeout=75)
+    # list endpoints can return every item in one very large body, which is read in 4 MiB pieces instead of 64 KiB.
+    return aiohttp.ClientSession(connector=connector, json_serialize=json_dumps, read_bufsize=_READ_BUFFER_SIZE)
+
+
+def _discard_session(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+    """Close or detach a replaced shared session, which can not be awaited since it belongs to another loop."""
+    if session.closed:
+        return
+    if loop.is_running():
+        # the loop is running in another thread, so the session is closed in that loop.
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        # the connections of a loop that stopped can no longer be closed, so the session is only detached from them.
+        session.detach()
+
+
+def get_shared_session(limit: int = 64, limit_per_host: int = 32) -> aiohttp.ClientSession:
+    """
+    Get the web session shared by every :class:`UCube.UCubeClientAsync` that was not given a web session.
+
+    The session is created on first use so that connections to UCube are reused across clients.
+    This must be called while the event loop is running, and :func:`close_shared_session` must be awaited
+    before that loop ends since a client never closes the shared session itself.
+
+    Parameters
+    ----------
+    limit: int
+        The maximum amount of connections the session will open.
+        Only used when the session is created.
+    limit_per_host: int
+        The maximum amount of connections the session will open to a single host.
+        Only used when the session is created.
+
+    Returns
+    -------
+    The shared web session.: :class:`aiohttp.ClientSession`
+    """
+    global _shared_session
+    loop = asyncio.get_running_loop()
+    if not _shared_session or _shared_session[0] is not loop or _shared_session[1].closed:
+        if _shared_session:
+            _discard_session(*_shared_session)
+        _shared_session = (loop, _create_session(limit, limit_per_host))
+    return _shared_session[1]
+
+
+async def close_shared_session():
+    """
+    Close the shared web session if it was created.
+
+    This is a coroutine and must be awaited.
+    """
+    global _shared_session
+    if _shared_session:
+        session = _shared_session[1]
+        _shared_session = None
+        await session.close()
 
 
 class UCubeClientAsync(UCubeClient):
     r"""
     Asynchronous UCube Client that Inherits from :ref:`UCubeClient`.
 
+    The client can be used as an async context manager, in which case it will own a web session
+    for as long as the block runs and close it on exit.
+
+    .. code-block:: python
+
+        async with UCubeClientAsync(username=username, password=password) as ucube_client:
+            await ucube_client.start()
+
     Parameters
     ----------
     loop:
-        Asyncio Event Loop
+        Asyncio Event Loop. Defaults to the running event loop when :meth:`start` is called.
     kwargs:
         Args for :ref:`UCubeClient`.
 
@@ -29,19 +132,78 @@ class UCubeClientAsync(UCubeClient):
 
     """
 
-    def __init__(self, loop=get_event_loop(), **kwargs):
+    __slots__ = ('loop', '__semaphore', '__token_lock', '__items_cache', '__etags', '__stop_event')
+
+    def __init__(self, loop=None, **kwargs):
         self.loop = loop
         super().__init__(**kwargs)
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__token_lock: Optional[asyncio.Lock] = None
+        # the time a response was received along with its objects for list endpoints that rarely change.
+        self.__items_cache: Dict[str, Tuple[float, list]] = {}
+        # the ETag of the last response of a URL that is polled along with what was made from that response.
+        # only the most recently used URLs are kept.
+        self.__etags: Dict[str, Tuple[str, Any]] = OrderedDict()
+        # set when the hook loop is stopped so that it does not have to finish waiting for the next check.
+        self.__stop_event: Optional[asyncio.Event] = None
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        """The semaphore bounding the amount of open requests to UCube."""
+        # created on first use so that it belongs to the running loop.
+        if not self.__semaphore:
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.__semaphore
+
+    def _build_headers(self, token: Optional[str]) -> CIMultiDictProxy:
+        """
+        Build the headers that are sent with every request to an endpoint.
 
-    def __del__(self):
-        """Terminate the web session if it was created by this object."""
-        try:
-            if self._own_session and not self.web_session.closed:
-                loop = asyncio.get_event_loop()
-                if loop:
-                    loop.create_task(self.web_session.close())  # only triggered if the client has further async code.
-        except Exception:
-            ...
+        The headers are built as the case-insensitive mapping aiohttp uses for headers.
+
+        Parameters
+        ----------
+        token: Optional[str]
+            The token used for endpoints.
+
+        Returns
+        -------
+        The headers.: :class:`multidict.CIMultiDictProxy`
+        """
+        return CIMultiDictProxy(CIMultiDict([(aiohttp.hdrs.AUTHORIZATION, f"Bearer {token}")]))
+
+    async def _ensure_token(self):
+        """
+        Get a working token again if the current one expired.
+
+        Only one request will reinstate the token while any others wait for it.
+
+        This is a coroutine and must be awaited.
+        """
+        if not self.__token_lock:
+            self.__token_lock = asyncio.Lock()
+        async with self.__token_lock:
+            # another request may have already reinstated the token while this one waited.
+            if self.expired_token:
+                await self._reinstate_token()
+
+    async def __aenter__(self):
+        if not self.web_session:
+            self.web_session = _create_session()
+            self._own_session = True  # we own the session and need to close it.
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the web session if it was created by this client.
+
+        This is a coroutine and must be awaited.
+        """
+        if self._own_session and self.web_session and not self.web_session.closed:
+            await self.web_session.close()
 
     async def start(self, load_boards=True, load_posts=True, load_notices=True, load_media=True,
                     load_from_artist=True, load_to_artist=False, load_talk=False, load_comments=False,
@@ -80,6 +242,10 @@ class UCubeClientAsync(UCubeClient):
             ``load_posts`` set to ``True``. Attempting to load any posts will not work
             without ``load_boards`` set to ``True``.
 
+        .. note:: If the client was not given a web session and is not used as an async context manager,
+            it uses the session from :func:`get_shared_session`. :meth:`close` does not close that session,
+            so :func:`close_shared_session` must be awaited before the event loop ends.
+
         :raises: :class:`UCube.error.InvalidToken`
             If the token was invalid.
         :raises: :class:`UCube.error.InvalidCredentials`
@@ -91,10 +257,13 @@ class UCubeClientAsync(UCubeClient):
         :raises: :class:`asyncio.exceptions.TimeoutError`
             Waited too long for a login.
         """
+        if not self.loop:
+            self.loop = asyncio.get_running_loop()
+
         try:
             if not self.web_session:
-                self.web_session = aiohttp.ClientSession()
-                self._own_session = True  # we own the session and need to close it.
+                # the shared session is closed with close_shared_session instead of by this client.
+                self.web_session = get_shared_session()
 
             if not self._login_info_exists and not self._token_exists:
                 raise InvalidCredentials
@@ -106,34 +275,51 @@ class UCubeClientAsync(UCubeClient):
             if not await self.check_token_works():
                 raise InvalidToken
 
-            for club in await self.fetch_all_clubs():
-                if follow_all_clubs:
-                    await self.follow_club(club.slug)
-
-                club.notifications = await self.fetch_club_notifications(club.slug)
-
-                if not load_boards:
-                    continue
-
-                for board in await self.fetch_club_boards(club.slug):
-                    club.boards[board.slug] = board
-
-                    board_name = str(board)
-
-                    # cases to go to the next board.
-                    no_notices = not load_notices and board_name == "Notice"
-                    no_media = not load_media and board_name == "Media"
-                    no_to_artist = not load_to_artist and board_name == f"To {club.artist_name}"
-                    no_from_artist = not load_from_artist and board_name == f"From {club.artist_name}"
-                    no_talk = not load_talk and board_name == "Talk"
+            # every level of the cache is requested concurrently since the requests do not depend on each other.
+            clubs = await self._fetch_all_pages(self._fetch_clubs_page, "clubs_per_page")
+
+            follow_tasks = [self.follow_club(club.slug) for club in clubs] if follow_all_clubs else []
+            notification_tasks = [self._fetch_all_pages(self._fetch_notifications_page, "notifications_per_page",
+                                                        club.slug) for club in clubs]
+            results = await self._gather(*follow_tasks, *notification_tasks)
+            for club, notifications in zip(clubs, results[len(follow_tasks):]):
+                club.notifications = notifications or []
+
+            if load_boards:
+                boards_to_load = []
+                club_boards = await self._gather(*[self.fetch_club_boards(club.slug) for club in clubs])
+                # names of the boards that are the same for every club and should not have their posts loaded.
+                skip_board_names = {name for name, load in (("Notice", load_notices), ("Media", load_media),
+                                                            ("Talk", load_talk)) if not load}
+                for club, boards in zip(clubs, club_boards):
+                    boards = boards or []
+                    club.boards.update((board.slug, board) for board in boards)
+
+                    club_skip_board_names = skip_board_names.copy()
+                    if not load_to_artist:
+                        club_skip_board_names.add(f"To {club.artist_name}")
+                    if not load_from_artist:
+                        club_skip_board_names.add(f"From {club.artist_name}")
+
+                    boards_to_load.extend(board for board in boards if load_posts and
+                                          str(board) not in club_skip_board_names)
+
+                board_posts = await self._gather(
+                    *[self._fetch_all_pages(self._fetch_posts_page, "posts_per_page", board.slug, feed=True)
+                      for board in boards_to_load])
+                loaded_posts = []
+                for board, posts in zip(boards_to_load, board_posts):
+                    if posts:
+                        board.posts.update((post.slug, post) for post in posts)
+                        loaded_posts.extend(posts)
 
-                    if not load_posts or no_notices or no_media or no_to_artist or no_from_artist or no_talk:
-                        continue
+                if load_comments:
+                    post_comments = await self._run_bounded(
+                        lambda post: self._fetch_all_pages(self._fetch_comments_page, "comments_per_page", post.slug),
+                        loaded_posts)
+                    for post, comments in zip(loaded_posts, post_comments):
+                        post.comments = comments or []
 
-                    for post in await self.fetch_board_posts(board.slug, feed=True):
-                        board.posts[post.slug] = post
-                        if load_comments:
-                            post.comments = await self.fetch_post_comments(post.slug)
             self.cache_loaded = True
             if self.verbose:
                 print("UCube Client Cache is now fully loaded.")
@@ -143,11 +329,161 @@ class UCubeClientAsync(UCubeClient):
                     print("UCube Client is now starting to check for new notifications.")
                 await self._start_loop_for_hook()
 
-        except Exception as err:
-            if self._own_session:
-                await self.web_session.close()
+        except Exception:
+            await self.close()
+
+            raise
+
+    def _handle_task_exception(self, exception: BaseException):
+        """
+        Decide whether an exception from a single concurrent task should stop the whole process.
+
+        Parameters
+        ----------
+        exception: :class:`BaseException`
+            The exception raised by the task.
+
+        :raises: The exception if it is critical, such as a failed login or being rate-limited.
+        """
+        if not isinstance(exception, Exception) or isinstance(exception, _CRITICAL_EXCEPTIONS):
+            raise exception
+        if self.verbose:
+            print(f"WARNING (NOT CRITICAL): A UCube request failed and was skipped. - {exception!r}")
+
+    async def _gather(self, *coroutines) -> list:
+        """
+        Run coroutines concurrently without letting one failed request stop the others.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        coroutines:
+            The coroutines to run.
+
+        Returns
+        -------
+        The results in the same order as the coroutines. Coroutines that failed have a result of None.: list
+
+        :raises: The first critical exception, such as a failed login or being rate-limited.
+        """
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                self._handle_task_exception(result)
+                results[index] = None
+        return results
+
+    async def _run_bounded(self, coroutine_function, items: list) -> list:
+        """
+        Await a coroutine function for every item with at most :attr:`max_concurrency` running at once.
 
-            raise err
+        The items are handed out from a queue to a fixed amount of workers so that there are not
+        thousands of tasks alive at once for large lists.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        coroutine_function:
+            The coroutine function to call with every item.
+        items: list
+            The items to pass in.
+
+        Returns
+        -------
+        The results in the same order as the items. Calls that failed have a result of None.: list
+        """
+        results = [None] * len(items)
+        queue = asyncio.Queue()
+        for index_and_item in enumerate(items):
+            queue.put_nowait(index_and_item)
+
+        async def worker():
+            while not queue.empty():
+                index, item = queue.get_nowait()
+                try:
+                    results[index] = await coroutine_function(item)
+                except Exception as e:
+                    self._handle_task_exception(e)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.max_concurrency, len(items)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        return results
+
+    async def _fetch_all_pages(self, fetch_page, per_page_arg: str, *args, **kwargs) -> list:
+        """
+        Fetch every page of a list endpoint.
+
+        The first page is fetched alone so that short lists only take one request.
+        After that, pages are fetched a few at a time until a page is not full.
+        A page that failed is retried once and then skipped, so the pages after it are still added.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        fetch_page:
+            The fetch method of the list endpoint. It must take in a ``page_number`` and return None if it failed.
+        per_page_arg: str
+            The name of the argument of ``fetch_page`` that sets the amount of items per page.
+        args:
+            Args for ``fetch_page``.
+        kwargs:
+            Keyword args for ``fetch_page``.
+
+        Returns
+        -------
+        Every item in the order they were returned with duplicates across pages removed.: list
+        """
+        kwargs[per_page_arg] = _PAGE_SIZE
+        items = {}
+
+        def add_page(page) -> bool:
+            """Add a page of items and return whether there may be more pages after it."""
+            items_before = len(items)
+            add_item = items.setdefault
+            for item in page:
+                add_item(item.slug, item)
+            # a page with nothing new means the endpoint is not paginating.
+            return len(page) == _PAGE_SIZE and len(items) > items_before
+
+        async def retry_page(number: int) -> Optional[list]:
+            """Fetch a failed page once more, with a working token if it had expired."""
+            if self.expired_token:
+                await self._ensure_token()
+            page, = await self._gather(fetch_page(*args, page_number=number, **kwargs))
+            if page is None and self.verbose:
+                print(f"WARNING (NOT CRITICAL): Page {number} of a UCube list failed twice and was skipped.")
+            return page
+
+        has_next_page = True
+        page_number = 1
+        window = 1
+        while has_next_page:
+            page_numbers = range(page_number, page_number + window)
+            pages = await self._gather(*[fetch_page(*args, page_number=number, **kwargs) for number in page_numbers])
+            added_page = False
+            for number, page in zip(page_numbers, pages):
+                if page is None:
+                    page = await retry_page(number)
+                if page is None:
+                    continue
+                added_page = True
+                has_next_page = add_page(page)
+                if not has_next_page:
+                    break
+            if not added_page:
+                # every page of the window failed, so UCube is not answering and the rest of the list is not known.
+                break
+            page_number += window
+            window = _PAGE_WINDOW
+        return list(items.values())
 
     async def _try_login(self):
         """
@@ -157,7 +493,7 @@ class UCubeClientAsync(UCubeClient):
         """
         self._login(self.__process_login)
 
-    async def __process_login(self, login_payload: dict):
+    async def __process_login(self, login_body: bytes):
         """
         Will process login credentials and set refresh token and token.
 
@@ -165,23 +501,244 @@ class UCubeClientAsync(UCubeClient):
 
         Parameters
         ----------
-        login_payload: dict
-            The client's login payload
-        """
-        async with self.web_session.post(url=self._auth_login_url, json=login_payload) as resp:
-            data = await resp.json()
-            if self._check_status(resp.status, self._auth_login_url, message=data.get("message")):
-                refresh_token = data.get("refresh_token")
-                token = data.get("token")
-                if refresh_token:
-                    self._set_refresh_token(refresh_token)
-                if token:
-                    self._set_token(token)
-                self.expired_token = False
+        login_body: bytes
+            The client's login payload as JSON.
+        """
+        url = self._auth_login_url
+        async with self.web_session.post(url=url, data=login_body, headers=self._json_headers) as resp:
+            if self._process_auth_response(resp.status, url, await resp.read()):
                 return
         self._set_exception(LoginFailed())
 
-    @check_expired_token
+    def _decode_body(self, status: int, url: str, body: bytes, custom_error_messages=None) -> Optional[dict]:
+        """
+        Decode a JSON response body after checking the status of the response.
+
+        Parameters
+        ----------
+        status: int
+            The status code of the response.
+        url: str
+            The URL the response came from.
+        body: bytes
+            The raw response body.
+        custom_error_messages: Dict[int, str]
+            Any specific error messages for certain statuses.
+
+        Returns
+        -------
+        The decoded body if the request was successful.: Optional[dict]
+        """
+        try:
+            data = json_loads(body) if body else {}
+        except ValueError:
+            data = {}
+
+        message = (data.get("message") if isinstance(data, dict) else None) or ""
+        if self._check_status(status, url, custom_error_messages, message=message):
+            return data
+
+    async def _send(self, method: str, url: str, create=None, revalidate=False, **kwargs) -> Tuple[int, Any]:
+        """
+        Send a request to UCube and read the response.
+
+        The amount of requests open at once is bound by :attr:`max_concurrency`.
+        A rate-limited request is retried a few times with a growing delay.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method to use.
+        url: str
+            The URL to send the request to.
+        create:
+            If given, the items of a successful response are parsed with ijson as the body is received.
+            They are created by this method in chunks once the request is done and the semaphore is released.
+        revalidate: bool
+            Whether to ask UCube if the response changed since the last one.
+            If it did not, the last response is reused instead of being sent again.
+        kwargs:
+            Args for the request.
+
+        Returns
+        -------
+        The status and either the created objects or the raw body.: Tuple[int, Any]
+
+        :raises: :class:`UCube.error.BeingRateLimited` If the request was still rate-limited after every retry.
+        """
+        if self.expired_token:
+            await self._ensure_token()
+
+        for retry_delay in (*_RATE_LIMIT_DELAYS, None):
+            headers = self._headers
+            cached = self.__etags.get(url) if revalidate else None
+            if cached:
+                headers = CIMultiDict(headers)
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = cached[0]
+
+            async with self._semaphore:
+                async with self.web_session.request(method, url, headers=headers, **kwargs) as resp:
+                    status = resp.status
+                    if status == 304 and cached:
+                        _remember_etag(self.__etags, url, cached)
+                        return 200, list(cached[1]) if create else cached[1]
+                    if status == 200 and create:
+                        result = [raw_item async for raw_item in
+                                  ijson.items(resp.content, "items.item", use_float=True)]
+                    else:
+                        result = await resp.read()
+                    etag = resp.headers.get(aiohttp.hdrs.ETAG) if revalidate and status == 200 else None
+
+            if status == 200 and create:
+                result = await self._create_items(result, create)
+            if etag:
+                _remember_etag(self.__etags, url, (etag, list(result) if create else result))
+            if status != 429:
+                return status, result
+            if retry_delay is None:
+                raise BeingRateLimited
+            if self.verbose:
+                print(f"WARNING (NOT CRITICAL): {url} was rate-limited. Retrying in {retry_delay} second(s).")
+            # the semaphore is released while waiting so other requests are not held up.
+            await asyncio.sleep(retry_delay)
+
+    async def _request_json(self, method: str, url: str, custom_error_messages=None, **kwargs) -> Optional[dict]:
+        """
+        Send a request to UCube and decode the JSON body.
+
+        The amount of requests open at once is bound by :attr:`max_concurrency`.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method to use.
+        url: str
+            The URL to send the request to.
+        custom_error_messages: Dict[int, str]
+            Any specific error messages for certain statuses.
+        kwargs:
+            Args for the request.
+
+        Returns
+        -------
+        The decoded body if the request was successful.: Optional[dict]
+        """
+        status, body = await self._send(method, url, **kwargs)
+        return self._decode_body(status, url, body, custom_error_messages)
+
+    async def _get_items(self, url: str, create, ttl: float = 0, revalidate=False) -> Optional[list]:
+        """
+        Get the objects of a UCube list endpoint, reusing a recent response if one is cached.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        url: str
+            The URL to send the request to.
+        create:
+            The method that creates an object from a raw item.
+        ttl: float
+            The amount of seconds a successful response is reused for. Nothing is cached if it is 0.
+        revalidate: bool
+            Whether to reuse the last response if UCube says it did not change.
+
+        Returns
+        -------
+        The created objects if the request was successful.: Optional[list]
+        """
+        if ttl:
+            cached = self.__items_cache.get(url)
+            if cached and monotonic() - cached[0] < ttl:
+                return list(cached[1])
+
+        items = await self._receive_items(url, create, revalidate)
+        if ttl and items is not None:
+            self.__items_cache[url] = (monotonic(), items)
+            items = list(items)
+        return items
+
+    async def _receive_items(self, url: str, create, revalidate=False) -> Optional[list]:
+        """
+        Send a GET request to a UCube list endpoint and create an object for every item.
+
+        If ijson is installed, the items are parsed as the body is received instead of decoding the whole
+        body at once. Either way, the objects are created in chunks after the response is read.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        url: str
+            The URL to send the request to.
+        create:
+            The method that creates an object from a raw item.
+        revalidate: bool
+            Whether to reuse the last response if UCube says it did not change.
+
+        Returns
+        -------
+        The created objects if the request was successful.: Optional[list]
+        """
+        if not ijson:
+            data = await self._request_json("GET", url, revalidate=revalidate)
+            return None if data is None else await self._create_items(data.get("items"), create)
+
+        status, result = await self._send("GET", url, create=create, revalidate=revalidate)
+        if status == 200:
+            return result
+
+        # the status was not successful, but the body is still needed for the error message.
+        self._decode_body(status, url, result)
+
+    @staticmethod
+    async def _create_items(raw_items: List[dict], create) -> list:
+        """
+        Create an object for every raw item of a decoded body.
+
+        A large page of items is created in chunks so that other tasks are not held up until every item is created.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        raw_items: List[dict]
+            The raw items.
+        create:
+            The method that creates an object from a raw item.
+
+        Returns
+        -------
+        The created objects.: list
+        """
+        items = []
+        for start in range(0, len(raw_items), _CREATE_CHUNK_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            items.extend(UCubeClient._create_objects(create, raw_items[start:start + _CREATE_CHUNK_SIZE]))
+        return items
+
+    async def _get_json(self, url: str) -> Optional[dict]:
+        """
+        Send a GET request to UCube and decode the JSON body.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        url: str
+            The URL to send the request to.
+
+        Returns
+        -------
+        The decoded body if the request was successful.: Optional[dict]
+        """
+        return await self._request_json("GET", url)
+
     async def fetch_club_boards(self, club_slug: str) -> List[models.Board]:
         """
         Retrieve a list of Boards from a Club.
@@ -197,21 +754,11 @@ class UCubeClientAsync(UCubeClient):
         -------
         A list of Boards: List[:class:`models.Board`]
         """
-        boards = []
-        replace_kwargs = {
-            "{club_slug}": club_slug
-        }
-        url = self.replace(self._boards_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status, url):
-                data = await resp.json()
-                for raw_board in data.get("items"):
-                    board = create_board(raw_board)
-                    boards.append(board)
-                    self.boards[board.slug] = board
+        url = self.replace(self._boards_url, club_slug=club_slug)
+        boards = await self._get_items(url, models.Board, ttl=_BOARDS_TTL) or []
+        self._store(boards)
         return boards
 
-    @check_expired_token
     async def fetch_board_posts(self, board_slug: str, feed=False, posts_per_page: int = 99999, page_number: int = 1) \
             -> List[models.Post]:
         """
@@ -234,25 +781,22 @@ class UCubeClientAsync(UCubeClient):
         -------
         A list of Posts: List[:class:`models.Post`]
         """
-        posts = []
-        replace_kwargs = {
-            "{board_slug}": board_slug,
-            "{feed_amount}": str(posts_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._posts_url if not feed else self._feeds_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status, url):
-                data = await resp.json()
-                for raw_post in data.get("items"):
-                    post = create_post(raw_post)
-                    posts.append(post)
-                    if post.user:
-                        self.users[post.user.slug] = post.user
-                    self.posts[post.slug] = post
+        return await self._fetch_posts_page(board_slug, feed, posts_per_page, page_number) or []
+
+    async def _fetch_posts_page(self, board_slug: str, feed=False, posts_per_page: int = 99999,
+                                page_number: int = 1) -> Optional[List[models.Post]]:
+        """Retrieve a page of Posts from a board, or None if the request failed.
+
+        This is a coroutine and must be awaited.
+        """
+        url_template = self._posts_url if not feed else self._feeds_url
+        url = self.replace(url_template, board_slug=board_slug, feed_amount=posts_per_page, page_number=page_number)
+        posts = await self._get_items(url, create_post)
+        if posts:
+            self._store([post.user for post in posts if post.user])
+            self._store(posts)
         return posts
 
-    @check_expired_token
     async def fetch_club_notifications(self, club_slug: str, notifications_per_page: int = 99999,
                                        page_number: int = 1) -> List[models.Notification]:
         """
@@ -273,23 +817,49 @@ class UCubeClientAsync(UCubeClient):
         -------
         A list of Notifications: List[:class:`models.Notification`]
         """
-        notifications = []
-        replace_kwargs = {
-            "{club_slug}": club_slug,
-            "{feed_amount}": str(notifications_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._notifications_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            data = await resp.json()
-            if self._check_status(resp.status, url, message=data.get("message")):
-                for raw_notification in data.get("items"):
-                    notification = create_notification(raw_notification)
-                    notifications.append(notification)
-                    self.notifications[notification.slug] = notification
+        return await self._fetch_notifications_page(club_slug, notifications_per_page, page_number) or []
+
+    async def _fetch_notifications_page(self, club_slug: str, notifications_per_page: int = 99999,
+                                        page_number: int = 1) -> Optional[List[models.Notification]]:
+        """Retrieve a page of Notifications from a club, or None if the request failed.
+
+        This is a coroutine and must be awaited.
+        """
+        url = self.replace(self._notifications_url, club_slug=club_slug, feed_amount=notifications_per_page,
+                           page_number=page_number)
+        # notifications are polled for, so they are only sent again if they changed.
+        notifications = await self._get_items(url, models.Notification, revalidate=True)
+        self._store(notifications)
         return notifications
 
-    @check_expired_token
+    async def fetch_notifications_many(self, club_slugs: List[str], notifications_per_page: int = 99999,
+                                       page_number: int = 1) -> Dict[str, List[models.Notification]]:
+        """
+        Retrieve the Notifications of several clubs at once.
+
+        The requests are sent concurrently instead of one after another.
+
+        This is a coroutine and must be awaited.
+
+        Parameters
+        ----------
+        club_slugs: List[str]
+            The slugs (unique identifiers) of the clubs to search the notifications for.
+        notifications_per_page: int
+            The amount of notifications to retrieve per page for each club.
+        page_number: int
+            The page number when paginating.
+
+        Returns
+        -------
+        The Notifications of each club by club slug. A club is left out if its request failed.:
+        Dict[str, List[:class:`models.Notification`]]
+        """
+        results = await self._gather(*[self.fetch_club_notifications(club_slug, notifications_per_page, page_number)
+                                       for club_slug in club_slugs])
+        return {club_slug: notifications for club_slug, notifications in zip(club_slugs, results)
+                if notifications is not None}
+
     async def fetch_post_comments(self, post_slug: str, comments_per_page: int = 99999,
                                   page_number: int = 1) -> List[models.Comment]:
         """
@@ -310,23 +880,20 @@ class UCubeClientAsync(UCubeClient):
         -------
         A list of Comments: List[:class:`models.Comment`]
         """
-        comments = []
-        replace_kwargs = {
-            "{post_slug}": post_slug,
-            "{feed_amount}": str(comments_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._comments_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status, url):
-                data = await resp.json()
-                for raw_comment in data.get("items"):
-                    comment = create_comment(raw_comment)
-                    comments.append(comment)
-                    self.comments[comment.slug] = comment
+        return await self._fetch_comments_page(post_slug, comments_per_page, page_number) or []
+
+    async def _fetch_comments_page(self, post_slug: str, comments_per_page: int = 99999,
+                                   page_number: int = 1) -> Optional[List[models.Comment]]:
+        """Retrieve a page of Comments from a Post, or None if the request failed.
+
+        This is a coroutine and must be awaited.
+        """
+        url = self.replace(self._comments_url, post_slug=post_slug, feed_amount=comments_per_page,
+                           page_number=page_number)
+        comments = await self._get_items(url, create_comment)
+        self._store(comments)
         return comments
 
-    @check_expired_token
     async def fetch_post(self, post_slug: str, load_comments=False) -> Optional[models.Post]:
         """
         Fetch a Post by it's slug.
@@ -345,21 +912,16 @@ class UCubeClientAsync(UCubeClient):
         The Post Object if there is one.: :class:`models.Post`
 
         """
-        replace_kwargs = {
-            "{post_slug}": post_slug
-        }
-        url = self.replace(self._single_post_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status, url):
-                raw_post = await resp.json()
-                post = create_post(raw_post)
-                if load_comments:
-                    post.comments = await self.fetch_post_comments(post.slug)
-                self.posts[post.slug] = post
-                return post
+        url = self.replace(self._single_post_url, post_slug=post_slug)
+        raw_post = await self._get_json(url)
+        if raw_post is not None:
+            post = create_post(raw_post)
+            if load_comments:
+                post.comments = await self.fetch_post_comments(post.slug)
+            self.posts[post.slug] = post
+            return post
         return
 
-    @check_expired_token
     async def fetch_all_clubs(self, clubs_per_page: int = 99999, page_number: int = 1) -> List[models.Club]:
         """
         Fetch all Clubs from the UCube API.
@@ -370,23 +932,18 @@ class UCubeClientAsync(UCubeClient):
         -------
         A list of Clubs: List[:class:`models.Club`]
         """
-        clubs = []
+        return await self._fetch_clubs_page(clubs_per_page, page_number) or []
 
-        replace_kwargs = {
-            "{feed_amount}": str(clubs_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._all_clubs_url, **replace_kwargs)
-        async with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status, url):
-                data = await resp.json()
-                for raw_club in data.get("items"):
-                    club = create_club(raw_club)
-                    clubs.append(club)
-                    self.clubs[club.slug] = club
+    async def _fetch_clubs_page(self, clubs_per_page: int = 99999, page_number: int = 1) -> Optional[List[models.Club]]:
+        """Retrieve a page of Clubs, or None if the request failed.
+
+        This is a coroutine and must be awaited.
+        """
+        url = self.replace(self._all_clubs_url, feed_amount=clubs_per_page, page_number=page_number)
+        clubs = await self._get_items(url, create_club, ttl=_CLUBS_TTL)
+        self._store(clubs)
         return clubs
 
-    @check_expired_token
     async def follow_club(self, club_slug: str) -> bool:
         """
         Follow a club.
@@ -403,20 +960,18 @@ class UCubeClientAsync(UCubeClient):
         Whether following the Club was successful.: :class:`bool`
 
         """
-        replace_kwargs = {
-            "{club_slug}": club_slug,
-        }
         payload = {
-            "nick_name": ''.join(SystemRandom().choice(ascii_letters + digits) for _ in range(10))
+            # 10 random alphanumeric characters.
+            "nick_name": token_hex(5)
         }
-        url = self.replace(self._follow_club_url, **replace_kwargs)
-        headers = self._headers
-        async with self.web_session.post(url=url, headers=headers, json=payload) as resp:
-            custom_error_message = {400: f"WARNING (NOT CRITICAL): Could not follow Club Slug: {club_slug} either due "
-                                         f"to a bad argument or they are already being followed."}
-            return self._check_status(resp.status, url, custom_error_message)
-
-    @check_expired_token
+        url = self.replace(self._follow_club_url, club_slug=club_slug)
+        followed = await self._request_json("POST", url, lambda: self._follow_error_messages(club_slug),
+                                            json=payload) is not None
+        if followed:
+            # the clubs and boards available to the account may have changed.
+            self.__items_cache.clear()
+        return followed
+
     async def check_new_notifications(self) -> List[models.Notification]:
         """
         Checks and returns new notifications for every club.
@@ -431,19 +986,29 @@ class UCubeClientAsync(UCubeClient):
         A list of new Notifications.: List[:class:`models.Notification`]
         """
         all_new_notifications = []
-        for club in self.clubs.values():
-            notifications = await self.fetch_club_notifications(club.slug, notifications_per_page=15)
-            new_notifications = [notification for notification in notifications if notification not in
-                                 club.notifications]
-            all_new_notifications = all_new_notifications + new_notifications
-            club.notifications = club.notifications + new_notifications
-
-            for notification in new_notifications:
-                if notification.post_slug:
-                    # will add new Post to cache if it exists.
-                    await self.fetch_post(notification.post_slug)
+        club_notifications = await self.fetch_notifications_many(list(self.clubs), notifications_per_page=15)
+        for club_slug, notifications in club_notifications.items():
+            club = self.clubs.get(club_slug)
+            if not club or not notifications:
+                continue
+            existing_slugs = {notification.slug for notification in club.notifications}
+            new_notifications = [notification for notification in notifications if notification.slug not in
+                                 existing_slugs]
+            if new_notifications:
+                all_new_notifications.extend(new_notifications)
+                club.notifications.extend(new_notifications)
+
+        # will add the new Posts to cache if they exist.
+        await self._run_bounded(self.fetch_post, [notification.post_slug for notification in all_new_notifications
+                                                  if notification.post_slug])
         return all_new_notifications
 
+    def stop(self):
+        """Stop the hook loop."""
+        super().stop()
+        if self.__stop_event:
+            self.__stop_event.set()
+
     async def _start_loop_for_hook(self):
         """
         Start checking for new notifications in a new loop and call the hook with the list of new Notifications
@@ -456,9 +1021,16 @@ class UCubeClientAsync(UCubeClient):
             raise NoHookFound
 
         self._hook_loop = True
+        self.__stop_event = asyncio.Event()
+        poll_interval = _POLL_INTERVAL
         while self._hook_loop:
-            await asyncio.sleep(25)
+            try:
+                await asyncio.wait_for(self.__stop_event.wait(), poll_interval)
+                break
+            except asyncio.TimeoutError:
+                pass
             new_notifications = await self.check_new_notifications()
+            poll_interval = self._next_poll_interval(poll_interval, bool(new_notifications))
             if not new_notifications:
                 continue
 
@@ -467,6 +1039,18 @@ class UCubeClientAsync(UCubeClient):
             else:
                 await self._hook(new_notifications)
 
+    async def _reinstate_token(self):
+        """
+        Get a working token again by refreshing it, or by logging in if there is no refresh token.
+
+        This is a coroutine and must be awaited.
+        """
+        if self._refresh_token_exists:
+            await self._refresh_token()
+        else:
+            await self._try_login()
+            await self._wait_for_login()  # wait for login or an exception to occur.
+
     async def _refresh_token(self):
         """
         Refresh a token while logged in.
@@ -475,13 +1059,9 @@ class UCubeClientAsync(UCubeClient):
 
         """
         payload = {"refresh_token": self._get_refresh_token()}
-        async with self.web_session.post(url=self._refresh_auth_url, json=payload) as resp:
-            data = await resp.json()
-            if self._check_status(resp.status, self._refresh_auth_url, message=data.get("message")):
-                token = data.get("token")
-                if token:
-                    self._set_token(token)
-                self.expired_token = False
+        url = self._refresh_auth_url
+        async with self.web_session.post(url=url, json=payload) as resp:
+            if self._process_auth_response(resp.status, url, await resp.read()):
                 return
         self._set_exception(LoginFailed())
 
@@ -495,7 +1075,7 @@ class UCubeClientAsync(UCubeClient):
         """
         async with self.web_session.get(url=self._about_me_url, headers=self._headers) as resp:
             if resp.status == 200:
-                self._set_my_info(await resp.json())
+                self._set_my_info(json_loads(await resp.read()))
                 self.expired_token = False
                 return True
             elif resp.status == 401:
@@ -1,10 +1,49 @@
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
 from . import InvalidToken, LoginFailed
+
+try:
+    # orjson is optional, but decodes the large list responses much faster than the standard library.
+    from orjson import loads as json_loads, dumps as json_dumps_bytes
+
+    def json_dumps(obj) -> str:
+        """Serialize an object to a JSON string."""
+        return json_dumps_bytes(obj).decode()
+except ImportError:
+    from json import loads as json_loads, dumps as json_dumps
+
+    def json_dumps_bytes(obj) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json_dumps(obj).encode()
 from . import BASE_SITE
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 from .models import Post, Club, Board, User, Notification, Comment
 
+# the amount of seconds between checks for new notifications. The wait grows while nothing new is found.
+_POLL_INTERVAL = 25
+_MAX_POLL_INTERVAL = 300
+_POLL_BACKOFF = 1.5
+
+# the amount of polled URLs that the ETag of their last response is kept for.
+_MAX_ETAGS = 128
+
+
+@lru_cache(maxsize=1024)
+def _expand_url(url: str, items: tuple) -> str:
+    """Fill in a URL template with the (name, value) pairs of its args."""
+    return url.format_map(dict(items))
+
+
+def _remember_etag(etags: OrderedDict, url: str, entry: tuple):
+    """Keep the ETag entry of a URL, dropping the least recently used entries once there are too many."""
+    # the entry is moved to the end so that URLs that are still being polled are dropped last.
+    etags.pop(url, None)
+    etags[url] = entry
+    while len(etags) > _MAX_ETAGS:
+        etags.popitem(last=False)
+
 
 class UCubeClient:
     """
@@ -30,6 +69,9 @@ class UCubeClient:
     hook:
         A passed in method that will be called every time there is a new notification.
         This method must take in a list of :class:`models.Notification` objects.
+    max_concurrency: int
+        The maximum amount of requests an async client will have open to UCube at once.
+        Raising it loads the cache faster, but UCube may start rate-limiting the client.
 
     Attributes
     -----------
@@ -37,6 +79,8 @@ class UCubeClient:
         Whether to print out verbose messages.
     web_session:
         An aiohttp or requests client session.
+    max_concurrency: int
+        The maximum amount of requests an async client will have open to UCube at once.
     cache_loaded: bool
         Whether the Internal UCube Cache is fully loaded.
         This will change for a split moment when grabbing a new post.
@@ -51,9 +95,47 @@ class UCubeClient:
     notifications: Dict[:class:`str`, :class:`models.Notification`]
         A dict of all Notifications in cache with the slug as the key.
    """
+
+    __slots__ = ('verbose', 'max_concurrency', 'web_session', '__token', '__exception_to_raise', '__login_event',
+                 '__login_task', '_headers', '__login_payload', '__login_body', '__my_info', 'cache_loaded',
+                 '_own_session', '_hook', '_hook_loop', 'expired_token', 'clubs', 'boards', 'posts', 'users',
+                 'notifications', 'comments', '_caches')
+
+    _base_site = BASE_SITE
+    _api_url = _base_site + "v1/"
+
+    # query string params that we will just append to the URL.
+    _club_slug = "?club={club_slug}"
+    _board_slug = "?board={board_slug}"
+    _per_page_and_number = "per_page={feed_amount}&page={page_number}"
+
+    # slug is the unique identifier that UCube uses for a certain object.
+    _all_clubs_url = _api_url + "clubs?" + _per_page_and_number
+    _single_post_url = _api_url + "posts/{post_slug}"
+    _posts_url = _api_url + "posts" + "?board={board_slug}&" + _per_page_and_number
+    _boards_url = _api_url + "boards" + _club_slug
+    _feeds_url = _api_url + "feeds" + _board_slug + f"&{_per_page_and_number}"
+    _notifications_url = _api_url + "notifications" + _club_slug + f"&{_per_page_and_number}"
+    _comments_url = _api_url + "comments?post={post_slug}" + f"&{_per_page_and_number}&order=desc"
+
+    _club_info_url = _api_url + "clubs/{club_slug}"
+    _follow_club_url = _club_info_url + "/join"
+    # to this point, categories has not actually returned any items and is useless.
+    _categories_url = _api_url + "boards/{club_slug}/categories"
+
+    _refresh_auth_url = _api_url + "auth/refresh"
+    _auth_login_url = _api_url + "auth/login"
+    _sign_in_path_url = _base_site + "signin"
+
+    _about_me_url = _api_url + "me"
+
+    # the headers sent along with a body that was already serialized to JSON.
+    _json_headers = {"Content-Type": "application/json"}
+
     def __init__(self, username: str = None, password: str = None, token=None, web_session=None, verbose: bool = False,
-                 hook=None):
+                 hook=None, max_concurrency: int = 15):
         self.verbose = verbose
+        self.max_concurrency = max_concurrency
         self.web_session = web_session
 
         # we will allow invalid login information until the user uses the start method.
@@ -61,35 +143,13 @@ class UCubeClient:
 
         self.__exception_to_raise = None
 
-        self._headers: dict = self.__get_headers()
-
-        self._base_site = BASE_SITE
-        self._api_url = self._base_site + "v1/"
-
-        # query string params that we will just append to the URL.
-        self._club_slug = "?club={club_slug}"
-        self._board_slug = "?board={board_slug}"
-        self._per_page_and_number = "per_page={feed_amount}&page={page_number}"
-
-        # slug is the unique identifier that UCube uses for a certain object.
-        self._all_clubs_url = self._api_url + "clubs?" + self._per_page_and_number
-        self._single_post_url = self._api_url + "posts/{post_slug}"
-        self._posts_url = self._api_url + "posts" + "?board={board_slug}&" + self._per_page_and_number
-        self._boards_url = self._api_url + "boards" + self._club_slug
-        self._feeds_url = self._api_url + "feeds" + self._board_slug + f"&{self._per_page_and_number}"
-        self._notifications_url = self._api_url + "notifications" + self._club_slug + f"&{self._per_page_and_number}"
-        self._comments_url = self._api_url + "comments?post={post_slug}" + f"&{self._per_page_and_number}&order=desc"
+        # set whenever the login state changes so that anything waiting for a login can check it again.
+        # it is created when something first waits for a login so that it belongs to the running loop.
+        self.__login_event: Optional[asyncio.Event] = None
+        # the task of an async login that is still being processed.
+        self.__login_task: Optional[asyncio.Task] = None
 
-        self._club_info_url = self._api_url + "clubs/{club_slug}"
-        self._follow_club_url = self._club_info_url + "/join"
-        # to this point, categories has not actually returned any items and is useless.
-        self._categories_url = self._api_url + "boards/{club_slug}/categories"
-
-        self._refresh_auth_url = self._api_url + "auth/refresh"
-        self._auth_login_url = self._api_url + "auth/login"
-        self._sign_in_path_url = self._base_site + "signin"
-
-        self._about_me_url = self._api_url + "me"
+        self._headers = self._build_headers(token)
 
         self.__login_payload = {
             "id": username,
@@ -98,6 +158,8 @@ class UCubeClient:
             "refresh_token": None,
             "remember_me": True
         }
+        # the login payload serialized to JSON along with the refresh token it was serialized with.
+        self.__login_body: Optional[tuple] = None
 
         self.__my_info = {
         }
@@ -119,6 +181,16 @@ class UCubeClient:
         self.notifications: Dict[str, Notification] = {}
         self.comments: Dict[str, Comment] = {}
 
+        # the cache dict for every type of model.
+        self._caches: Dict[type, dict] = {
+            Club: self.clubs,
+            Board: self.boards,
+            Post: self.posts,
+            User: self.users,
+            Notification: self.notifications,
+            Comment: self.comments
+        }
+
     @property
     def _my_info_exists(self) -> bool:
         return bool(self.__my_info)
@@ -142,10 +214,73 @@ class UCubeClient:
         """Stop the hook loop."""
         self._hook_loop = False
 
+    @staticmethod
+    def _next_poll_interval(poll_interval: float, found_new: bool) -> float:
+        """
+        Get the amount of seconds to wait before checking for new notifications again.
+
+        The wait grows while nothing new is found and goes back to the shortest wait once something is.
+
+        Parameters
+        ----------
+        poll_interval: float
+            The amount of seconds that was waited before the last check.
+        found_new: bool
+            Whether the last check found new notifications.
+
+        Returns
+        -------
+        The amount of seconds to wait.: float
+        """
+        if found_new:
+            return _POLL_INTERVAL
+        return min(poll_interval * _POLL_BACKOFF, _MAX_POLL_INTERVAL)
+
     def _get_refresh_token(self) -> Optional[str]:
         """Get the refresh token."""
         return self.__login_payload["refresh_token"]
 
+    def _get_login_body(self) -> bytes:
+        """Get the login payload as JSON. It is only serialized again when the refresh token changes."""
+        refresh_token = self.__login_payload["refresh_token"]
+        if not self.__login_body or self.__login_body[0] != refresh_token:
+            self.__login_body = (refresh_token, json_dumps_bytes(self.__login_payload))
+        return self.__login_body[1]
+
+    def _store(self, objects: list):
+        """
+        Add models of the same type to the cache.
+
+        Parameters
+        ----------
+        objects: list
+            The models to add. They must all be the same type.
+        """
+        if objects:
+            self._caches[type(objects[0])].update((obj.slug, obj) for obj in objects)
+
+    @staticmethod
+    def _create_objects(create, raw_items: Iterable[dict]) -> list:
+        """
+        Create an object for every raw item of a list endpoint.
+
+        Parameters
+        ----------
+        create:
+            The method that creates an object from a raw item.
+            If it is a model class, the objects are created through :meth:`models.BaseModel.from_raw_list`.
+        raw_items: Iterable[dict]
+            The raw items.
+
+        Returns
+        -------
+        The created objects in the same order.: list
+        """
+        from_raw_list = getattr(create, "from_raw_list", None)
+        if from_raw_list:
+            return from_raw_list(raw_items)
+        return [create(raw_item) for raw_item in raw_items]
+
     def get_club(self, club_slug: str) -> Optional[Club]:
         """
         Get a Club if it exists.
@@ -248,39 +383,53 @@ class UCubeClient:
         :raises: :class:`UCube.error.LoginFailed` Login process had failed.
         :raises: :class:`asyncio.exceptions.TimeoutError` Waited too long for a login.
         """
-        seconds_passed = 0
+        if not self.__login_event:
+            self.__login_event = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(self.__wait_for_login_event(), timeout)
+        except asyncio.exceptions.TimeoutError:
+            # the login request is no longer waited for, so it should not be left open.
+            if self.__login_task and not self.__login_task.done():
+                self.__login_task.cancel()
+            raise asyncio.exceptions.TimeoutError() from None
+
+    async def __wait_for_login_event(self):
+        """Wait for the login event until the client is logged in or an exception occurred."""
         while not self._refresh_token_exists or self.expired_token:
-            if self.__exception_to_raise:
-                if isinstance(self.__exception_to_raise, (LoginFailed, asyncio.exceptions.TimeoutError)):
-                    exception = self.__exception_to_raise
-                    self.__exception_to_raise = None
-                    # if an exception was raised from here, the actual exception occurred in a task.
-                    raise exception
-            await asyncio.sleep(1)
-            seconds_passed += 1
-
-            if seconds_passed > timeout:
-                self._set_exception(asyncio.exceptions.TimeoutError())
+            if isinstance(self.__exception_to_raise, (LoginFailed, asyncio.exceptions.TimeoutError)):
+                exception = self.__exception_to_raise
+                self.__exception_to_raise = None
+                # if an exception was raised from here, the actual exception occurred in a task.
+                raise exception
+            self.__login_event.clear()
+            await self.__login_event.wait()
+
+    def __notify_login_change(self):
+        """Wake up anything waiting for a login."""
+        if self.__login_event:
+            self.__login_event.set()
 
     @staticmethod
     def replace(url, **kwargs) -> str:
         """
         Will replace the args in an endpoint url.
 
+        The same URLs are requested repeatedly when checking for new notifications,
+        so recently filled in URLs are cached.
+
         Parameters
         ----------
         url: str
             The URL to replace args for.
         kwargs: dict
-            The args that need to be replaced followed by what they need to be replaced with.
+            The names of the args in the URL without braces followed by what they need to be replaced with.
 
         Returns
         -------
         str
         """
-        for key, item in kwargs.items():
-            url = url.replace(key, item)
-        return url
+        return _expand_url(url, tuple(kwargs.items()))
 
     def _login(self, method):
         """
@@ -292,23 +441,68 @@ class UCubeClient:
         Parameters
         ----------
         method:
-            The async/sync method to call. Should be able to take in the login payload.
+            The async/sync method to call. Should be able to take in the login payload as JSON.
         """
         if not asyncio.iscoroutinefunction(method):
-            method(self.__login_payload)
+            method(self._get_login_body())
         else:
-            asyncio.create_task(method(self.__login_payload))
+            self.__login_task = asyncio.create_task(method(self._get_login_body()))
+            self.__login_task.add_done_callback(self.__login_task_done)
+
+    def __login_task_done(self, task: asyncio.Task):
+        """Pass on an exception from an async login so that anything waiting for the login is not left waiting."""
+        if self.__login_task is task:
+            self.__login_task = None
+        if task.cancelled() or not task.exception():
+            return
+
+        exception = LoginFailed()
+        exception.__cause__ = task.exception()
+        self._set_exception(exception)
 
-    def _set_refresh_token(self, refresh_token: str):
+    def _set_tokens(self, refresh_token: Optional[str], token: Optional[str]):
         """
-        Set the refresh token.
+        Set the refresh token and the token used for endpoints.
+
+        Either token is left unchanged if it is not given.
 
         Parameters
         ----------
-        refresh_token: str
+        refresh_token: Optional[str]
             The refresh token to pass when logging in.
+        token: Optional[str]
+            New token used for endpoints
+        """
+        if refresh_token:
+            self.__login_payload["refresh_token"] = refresh_token
+        if token:
+            self._set_token(token)
+        self.__notify_login_change()
+
+    def _process_auth_response(self, status: int, url: str, body: bytes) -> bool:
+        """
+        Set the tokens from the response of a login or a token refresh.
+
+        Parameters
+        ----------
+        status: int
+            The status code of the response.
+        url: str
+            The URL the response came from.
+        body: bytes
+            The raw response body.
+
+        Returns
+        -------
+        Whether the login or refresh was successful.: :class:`bool`
         """
-        self.__login_payload["refresh_token"] = refresh_token
+        data = json_loads(body)
+        if self._check_status(status, url, message=data.get("message")):
+            # a refresh only returns a new token, so the refresh token is kept.
+            self._set_tokens(data.get("refresh_token"), data.get("token"))
+            self.expired_token = False
+            return True
+        return False
 
     def _set_token(self, token):
         """
@@ -320,7 +514,8 @@ class UCubeClient:
             New token used for endpoints
         """
         self.__token = token
-        self._headers = self.__get_headers()  # update headers
+        self._headers = self._build_headers(token)  # update headers
+        self.__notify_login_change()
 
     def _set_my_info(self, my_info: dict):
         """
@@ -341,6 +536,53 @@ class UCubeClient:
         exception: The Exception that was raised.
         """
         self.__exception_to_raise = exception
+        self.__notify_login_change()
+
+    def _status_ok(self, status: int, url: str, custom_error_messages: Optional[Dict[int, str]], message: str) -> bool:
+        """Handle a successful response."""
+        return True
+
+    def _status_expired(self, status: int, url: str, custom_error_messages: Optional[Dict[int, str]], message: str):
+        """Handle a response for an expired token."""
+        self.expired_token = True
+        # raise InvalidToken
+        # InvalidToken no longer needs to be raised due to the next check outside of this function
+        # refreshing the login.
+
+    def _status_failed(self, status: int, url: str, custom_error_messages: Optional[Dict[int, str]], message: str):
+        """Handle any other response."""
+        if message and "Token Expired" in message:
+            return self._status_expired(status, url, custom_error_messages, message)
+
+        if not self.verbose:
+            return False
+
+        if callable(custom_error_messages):
+            custom_error_messages = custom_error_messages()
+        error_message = custom_error_messages.get(status) if custom_error_messages else None
+        if not error_message:
+            error_message = self._error_messages.get(status, self._error_messages[-1]).format(url=url, status=status)
+        print(error_message)
+
+    @staticmethod
+    def _follow_error_messages(club_slug: str) -> Dict[int, str]:
+        """Get the error messages for following a Club."""
+        return {400: f"WARNING (NOT CRITICAL): Could not follow Club Slug: {club_slug} either due "
+                     f"to a bad argument or they are already being followed."}
+
+    # the name of the handler method for each status code. Any other status is handled by _status_failed.
+    # names are stored instead of the functions so that a subclass can override a handler.
+    _status_handlers = {
+        200: "_status_ok",
+        401: "_status_expired"
+    }
+
+    # the url and status are filled in when the message is printed.
+    _error_messages = {
+        400: "WARNING (NOT CRITICAL): {url} was sent a bad request.",
+        404: "WARNING (NOT CRITICAL): {url} was not found.",
+        -1: "WARNING (NOT CRITICAL): {url} Failed to load. [Status: {status}]"
+    }
 
     def _check_status(self, status, url, custom_error_messages: Dict[int, str] = None, message="") -> bool:
         """
@@ -349,35 +591,27 @@ class UCubeClient:
         :param status: Status code of url connection
         :param url: Link that we connected to.
         :param custom_error_messages: Any specific error messages for certain statuses.
+            This may also be a method that returns them, so they are only built when an error is printed.
         :param message: The body message.
         :return: True if the connection was a success.
         :raises: :ref:`invalid_token_exc` if there was an invalid token.
         """
-        error_messages = {
-            400: "WARNING (NOT CRITICAL): " + url + " was sent a bad request.",
-            404: "WARNING (NOT CRITICAL): " + url + " was not found.",
-            -1: "WARNING (NOT CRITICAL): " + url + " Failed to load. [Status: " + str(status) + "]"
-        }
+        handler = getattr(self, self._status_handlers.get(status, "_status_failed"))
+        return handler(status, url, custom_error_messages, message)
 
-        if custom_error_messages:
-            for key, value in custom_error_messages.items():
-                error_messages[key] = value
+    def _build_headers(self, token: Optional[str]):
+        """
+        Build the headers that are sent with every request to an endpoint.
 
-        error_message = error_messages.get(status)
+        They are only built again when the token changes.
 
-        if status == 200:
-            return True
-        elif status == 401 or "Token Expired" in message:
-            self.expired_token = True
-            # raise InvalidToken
-            # InvalidToken no longer needs to be raised due to the next check outside of this function
-            # refreshing the login.
-        else:
-            if not self.verbose:
-                return False
-            if not error_message:
-                error_message = error_messages.get(-1)
-            print(error_message)
-
-    def __get_headers(self):
-        return {'Authorization': f"Bearer {self.__token}"}
+        Parameters
+        ----------
+        token: Optional[str]
+            The token used for endpoints.
+
+        Returns
+        -------
+        The headers.: Dict[str, str]
+        """
+        return {'Authorization': f"Bearer {token}"}
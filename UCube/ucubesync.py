@@ -1,35 +1,180 @@
-import json
-import time
+import socket
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
 
 import requests
-from . import UCubeClient, InvalidToken, InvalidCredentials, LoginFailed, create_club, \
-    models, create_post, create_board, create_notification, create_comment, check_expired_token, NoHookFound
-from typing import List, Optional
-from random import SystemRandom
-from string import ascii_letters, digits
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from .ucubeclient import json_loads, _POLL_INTERVAL, _remember_etag
+from . import UCubeClient, InvalidToken, InvalidCredentials, LoginFailed, BeingRateLimited, create_club, \
+    models, create_post, create_comment, check_expired_token, NoHookFound
+from typing import Dict, List, Optional, Tuple
+from secrets import token_hex
+
+try:
+    # ijson is optional, but lets the list endpoints be parsed while they are still being received.
+    import ijson
+except ImportError:
+    ijson = None
+
+# the most threads used at once when several requests are sent together.
+# it is kept below the size of the connection pool so that every thread can reuse a connection.
+_MAX_THREADS = 16
+
+# the amount of items per page when the cache walks every page of a list.
+_PAGE_SIZE = 100
+
+# streamed bodies that are decoded whole are read in 64 KiB pieces instead of the default 10 KiB.
+_READ_CHUNK_SIZE = 64 * 1024
+
+# idle connections send TCP keep-alive probes so that they are not silently dropped between checks for new
+# notifications. Not every platform lets the timing of the probes be set.
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value) for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30))
+    if hasattr(socket, name)]
+
+# exceptions that stop the whole process instead of only the request they came from.
+_CRITICAL_EXCEPTIONS = (InvalidToken, InvalidCredentials, LoginFailed, BeingRateLimited)
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = Lock()
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connections are kept alive at the TCP level while they are idle."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session() -> requests.Session:
+    """Create a web session with a connection pool sized for UCube."""
+    session = requests.Session()
+    # every request goes to the same host, so a single pool is kept with room for more connections.
+    # failed requests are retried with a growing delay, and the last response is still checked as usual.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+    adapter = _KeepAliveAdapter(pool_connections=1, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the web session shared by every :class:`UCube.UCubeClientSync` that was not given a web session.
+
+    The session is created on first use so that connections to UCube are reused across clients.
+
+    Returns
+    -------
+    The shared web session.: :class:`requests.Session`
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if not _shared_session:
+            _shared_session = _create_session()
+        return _shared_session
+
+
+def close_shared_session():
+    """Close the shared web session if it was created."""
+    global _shared_session
+    with _shared_session_lock:
+        session, _shared_session = _shared_session, None
+    if session:
+        session.close()
 
 
 class UCubeClientSync(UCubeClient):
     r"""
     Synchronous UCube Client that Inherits from :ref:`UCubeClient`.
 
+    The client can be used as a context manager, in which case it will own a web session
+    for as long as the block runs and close it on exit.
+    Otherwise, a client that was not given a web session uses the one from :func:`get_shared_session`.
+
+    .. code-block:: python
+
+        with UCubeClientSync(username=username, password=password) as ucube_client:
+            ucube_client.start()
+
     Parameters
     ----------
     kwargs:
         Args for :ref:`UCubeClient`.
 
     """
+
+    __slots__ = ('__token_lock', '__etags', '__stop_event')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # only one thread reinstates an expired token while any others wait for it.
+        self.__token_lock = Lock()
+        # the ETag of the last response of a URL that is polled along with the objects made from that response.
+        # only the most recently used URLs are kept.
+        self.__etags: Dict[str, Tuple[str, list]] = OrderedDict()
+        # set when the hook loop is stopped so that it does not have to finish waiting for the next check.
+        self.__stop_event = Event()
 
     def __del__(self):
         """Terminate the web session if it was created by this object."""
         try:
-            if self._own_session:
-                self.web_session.close()
+            self.close()
         except Exception:
             ...
 
+    def __enter__(self):
+        self._create_own_session()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _create_own_session(self):
+        """Create a web session owned by this client if one was not passed in."""
+        if not self.web_session:
+            self.web_session = _create_session()
+            self._own_session = True  # we own the session and need to close it.
+            self._update_session_headers()
+
+    def close(self):
+        """Close the web session if it was created by this client."""
+        if self._own_session and self.web_session:
+            self.web_session.close()
+
+    @property
+    def _request_headers(self) -> Optional[dict]:
+        """The headers to send with a request, or None if the session already holds them."""
+        return None if self._own_session else self._headers
+
+    def _set_token(self, token):
+        """
+        Set the token used for endpoints.
+
+        If the client owns its session, the headers are stored on the session so they do not
+        have to be merged into every request.
+
+        Parameters
+        ----------
+        token: str
+            New token used for endpoints
+        """
+        super()._set_token(token)
+        self._update_session_headers()
+
+    def _update_session_headers(self):
+        """Store the headers on the session if the client owns it, but only once there is a token to send."""
+        if not self._own_session:
+            return
+        if self._token_exists:
+            self.web_session.headers.update(self._headers)
+        else:
+            self.web_session.headers.pop("Authorization", None)
+
     def start(self, load_boards=True, load_posts=True, load_notices=True, load_media=True,
               load_from_artist=True, load_to_artist=False, load_talk=False, load_comments=False,
               follow_all_clubs=True):
@@ -72,8 +217,8 @@ class UCubeClientSync(UCubeClient):
         """
         try:
             if not self.web_session:
-                self.web_session = requests.Session()
-                self._own_session = True  # we own the session and need to close it.
+                # the shared session is closed with close_shared_session instead of by this client.
+                self.web_session = get_shared_session()
 
             if not self._login_info_exists and not self._token_exists:
                 raise InvalidCredentials
@@ -84,34 +229,35 @@ class UCubeClientSync(UCubeClient):
             if not self.check_token_works():
                 raise InvalidToken
 
-            for club in self.fetch_all_clubs():
-                if follow_all_clubs:
-                    self.follow_club(club.slug)
-
-                club.notifications = self.fetch_club_notifications(club.slug)
-
-                if not load_boards:
-                    continue
-
-                for board in self.fetch_club_boards(club.slug):
-                    club.boards[board.slug] = board
+            clubs = self._fetch_all_pages(self._fetch_clubs_page, "clubs_per_page")
+            with ThreadPoolExecutor(max_workers=_MAX_THREADS) as executor:
+                club_boards = executor.map(lambda club: self._load_club(club, follow_all_clubs, load_boards), clubs)
+                boards_to_load = []
+                # names of the boards that are the same for every club and should not have their posts loaded.
+                skip_board_names = {name for name, load in (("Notice", load_notices), ("Media", load_media),
+                                                            ("Talk", load_talk)) if not load}
+                for club, boards in zip(clubs, club_boards):
+                    club_skip_board_names = skip_board_names.copy()
+                    if not load_to_artist:
+                        club_skip_board_names.add(f"To {club.artist_name}")
+                    if not load_from_artist:
+                        club_skip_board_names.add(f"From {club.artist_name}")
+
+                    boards_to_load.extend(board for board in boards if load_posts and
+                                          str(board) not in club_skip_board_names)
+
+                board_posts = executor.map(lambda board: self._fetch_all_pages(
+                    self._fetch_posts_page, "posts_per_page", board.slug, feed=True), boards_to_load)
+                posts = []
+                for board, fetched_posts in zip(boards_to_load, board_posts):
+                    board.posts.update((post.slug, post) for post in fetched_posts)
+                    posts.extend(fetched_posts)
 
-                    board_name = str(board)
-
-                    # cases to go to the next board.
-                    no_notices = not load_notices and board_name == "Notice"
-                    no_media = not load_media and board_name == "Media"
-                    no_to_artist = not load_to_artist and board_name == f"To {club.artist_name}"
-                    no_from_artist = not load_from_artist and board_name == f"From {club.artist_name}"
-                    no_talk = not load_talk and board_name == "Talk"
-
-                    if not load_posts or no_notices or no_media or no_to_artist or no_from_artist or no_talk:
-                        continue
-
-                    for post in self.fetch_board_posts(board.slug, feed=True):
-                        board.posts[post.slug] = post
-                        if load_comments:
-                            post.comments = self.fetch_post_comments(post.slug)
+                if load_comments:
+                    post_comments = executor.map(lambda post: self._fetch_all_pages(
+                        self._fetch_comments_page, "comments_per_page", post.slug), posts)
+                    for post, comments in zip(posts, post_comments):
+                        post.comments = comments
 
             self.cache_loaded = True
             if self.verbose:
@@ -122,11 +268,102 @@ class UCubeClientSync(UCubeClient):
                     print("UCube Client is now starting to check for new notifications.")
                 self._start_loop_for_hook()
 
-        except Exception as err:
-            if self._own_session:
-                self.web_session.close()
+        except Exception:
+            self.close()
+            raise
+
+    def _fetch_all_pages(self, fetch_page, per_page_arg: str, *args, **kwargs) -> list:
+        """
+        Fetch every page of a list endpoint until a page is not full.
+
+        A page that failed is retried once and then skipped, so the pages after it are still added.
 
-            raise err
+        Parameters
+        ----------
+        fetch_page:
+            The fetch method of the list endpoint. It must take in a ``page_number`` and return None if it failed.
+        per_page_arg: str
+            The name of the argument of ``fetch_page`` that sets the amount of items per page.
+        args:
+            Args for ``fetch_page``.
+        kwargs:
+            Keyword args for ``fetch_page``.
+
+        Returns
+        -------
+        Every item in the order they were returned with duplicates across pages removed.: list
+
+        :raises: The first critical exception, such as a failed login or being rate-limited.
+        """
+        kwargs[per_page_arg] = _PAGE_SIZE
+        items = {}
+        add_item = items.setdefault
+
+        def try_page(number: int) -> Optional[list]:
+            """Fetch a page, or get None if it failed with a status or an exception that is not critical."""
+            try:
+                return fetch_page(*args, page_number=number, **kwargs)
+            except _CRITICAL_EXCEPTIONS:
+                raise
+            except Exception as e:
+                if self.verbose:
+                    print(f"WARNING (NOT CRITICAL): A UCube request failed and was skipped. - {e!r}")
+
+        page_number = 1
+        skipped_before = False
+        while True:
+            # a failed page is retried once. The fetch methods get a working token again first if it expired.
+            page = try_page(page_number)
+            if page is None:
+                page = try_page(page_number)
+            if page is None:
+                if self.verbose:
+                    print(f"WARNING (NOT CRITICAL): Page {page_number} of a UCube list failed twice and was skipped.")
+                if skipped_before:
+                    # two pages in a row failed, so UCube is not answering and the rest of the list is not known.
+                    return list(items.values())
+                skipped_before = True
+                page_number += 1
+                continue
+
+            skipped_before = False
+            items_before = len(items)
+            for item in page:
+                add_item(item.slug, item)
+            # a page with nothing new means the endpoint is not paginating.
+            if len(page) < _PAGE_SIZE or len(items) == items_before:
+                return list(items.values())
+            page_number += 1
+
+    def _load_club(self, club: models.Club, follow_club: bool, load_boards: bool) -> List[models.Board]:
+        """
+        Follow a Club if needed and load its Notifications and Boards.
+
+        Parameters
+        ----------
+        club: :class:`models.Club`
+            The Club to load.
+        follow_club: bool
+            Whether to follow the Club.
+        load_boards: bool
+            Whether to load the Boards of the Club.
+
+        Returns
+        -------
+        The Boards of the Club.: List[:class:`models.Board`]
+        """
+        if follow_club:
+            self.follow_club(club.slug)
+
+        club.notifications = self._fetch_all_pages(self._fetch_notifications_page, "notifications_per_page",
+                                                   club.slug)
+
+        if not load_boards:
+            return []
+
+        boards = self.fetch_club_boards(club.slug)
+        club.boards.update((board.slug, board) for board in boards)
+        return boards
 
     def _try_login(self):
         """
@@ -136,28 +373,72 @@ class UCubeClientSync(UCubeClient):
         """
         self._login(self.__process_login)
 
-    def __process_login(self, login_payload: dict):
+    def __process_login(self, login_body: bytes):
         """
         Will process login credentials and set refresh token and token.
 
         Parameters
         ----------
-        login_payload: dict
-            The client's login payload
-        """
-        with self.web_session.post(url=self._auth_login_url, json=login_payload) as resp:
-            data = json.loads(resp.text)
-            if self._check_status(resp.status_code, self._auth_login_url, message=data.get("message")):
-                refresh_token = data.get("refresh_token")
-                token = data.get("token")
-                if refresh_token:
-                    self._set_refresh_token(refresh_token)
-                if token:
-                    self._set_token(token)
-                self.expired_token = False
+        login_body: bytes
+            The client's login payload as JSON.
+        """
+        with self.web_session.post(url=self._auth_login_url, data=login_body, headers=self._json_headers) as resp:
+            if self._process_auth_response(resp.status_code, self._auth_login_url, resp.content):
                 return
         raise LoginFailed
 
+    def _get_items(self, url: str, create, revalidate=False) -> Optional[list]:
+        """
+        Send a GET request to a UCube list endpoint and create an object for every item.
+
+        If ijson is installed, the items are created one by one as they are read from the socket instead of
+        loading and decoding the whole body first.
+
+        Parameters
+        ----------
+        url: str
+            The URL to send the request to.
+        create:
+            The method that creates an object from a raw item.
+        revalidate: bool
+            Whether to ask UCube if the response changed since the last one.
+            If it did not, the objects of the last response are reused.
+
+        Returns
+        -------
+        The created objects if the request was successful.: Optional[list]
+        """
+        headers = self._request_headers
+        cached = self.__etags.get(url) if revalidate else None
+        if cached:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+
+        with self.web_session.get(url=url, headers=headers, stream=True) as resp:
+            if resp.status_code == 304 and cached:
+                _remember_etag(self.__etags, url, cached)
+                return list(cached[1])
+
+            if resp.status_code == 200 and ijson:
+                # the raw stream is not decompressed unless asked to.
+                resp.raw.decode_content = True
+                items = self._create_objects(create, ijson.items(resp.raw, "items.item", use_float=True))
+            else:
+                try:
+                    data = json_loads(b"".join(resp.iter_content(_READ_CHUNK_SIZE)))
+                except ValueError:
+                    data = {}
+
+                message = (data.get("message") if isinstance(data, dict) else None) or ""
+                if not self._check_status(resp.status_code, url, message=message):
+                    return
+                items = self._create_objects(create, data.get("items"))
+
+            etag = resp.headers.get("ETag")
+
+        if revalidate and etag:
+            _remember_etag(self.__etags, url, (etag, list(items)))
+        return items
+
     @check_expired_token
     def fetch_club_boards(self, club_slug: str) -> List[models.Board]:
         """
@@ -172,21 +453,11 @@ class UCubeClientSync(UCubeClient):
         -------
         A list of Boards: List[:class:`models.Board`]
         """
-        boards = []
-        replace_kwargs = {
-            "{club_slug}": club_slug
-        }
-        url = self.replace(self._boards_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status_code, url):
-                data = json.loads(resp.text)
-                for raw_board in data.get("items"):
-                    board = create_board(raw_board)
-                    boards.append(board)
-                    self.boards[board.slug] = board
+        url = self.replace(self._boards_url, club_slug=club_slug)
+        boards = self._get_items(url, models.Board) or []
+        self._store(boards)
         return boards
 
-    @check_expired_token
     def fetch_board_posts(self, board_slug: str, feed=False, posts_per_page: int = 99999, page_number: int = 1) \
             -> List[models.Post]:
         """
@@ -207,25 +478,20 @@ class UCubeClientSync(UCubeClient):
         -------
         A list of Posts: List[:class:`models.Post`]
         """
-        posts = []
-        replace_kwargs = {
-            "{board_slug}": board_slug,
-            "{feed_amount}": str(posts_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._posts_url if not feed else self._feeds_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status_code, url):
-                data = json.loads(resp.text)
-                for raw_post in data.get("items"):
-                    post = create_post(raw_post)
-                    posts.append(post)
-                    if post.user:
-                        self.users[post.user.slug] = post.user
-                    self.posts[post.slug] = post
-        return posts
+        return self._fetch_posts_page(board_slug, feed, posts_per_page, page_number) or []
 
     @check_expired_token
+    def _fetch_posts_page(self, board_slug: str, feed=False, posts_per_page: int = 99999,
+                          page_number: int = 1) -> Optional[List[models.Post]]:
+        """Retrieve a page of Posts from a board, or None if the request failed."""
+        url = self.replace(self._posts_url if not feed else self._feeds_url, board_slug=board_slug,
+                           feed_amount=posts_per_page, page_number=page_number)
+        posts = self._get_items(url, create_post)
+        if posts:
+            self._store([post.user for post in posts if post.user])
+            self._store(posts)
+        return posts
+
     def fetch_club_notifications(self, club_slug: str, notifications_per_page: int = 99999,
                                  page_number: int = 1) -> List[models.Notification]:
         """
@@ -244,24 +510,48 @@ class UCubeClientSync(UCubeClient):
         -------
         A list of Notifications: List[:class:`models.Notification`]
         """
-        notifications = []
-        replace_kwargs = {
-            "{club_slug}": club_slug,
-            "{feed_amount}": str(notifications_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._notifications_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
-            data = json.loads(resp.text)
-            if self._check_status(resp.status_code, url, message=data.get("message")):
-                data = json.loads(resp.text)
-                for raw_notification in data.get("items"):
-                    notification = create_notification(raw_notification)
-                    notifications.append(notification)
-                    self.notifications[notification.slug] = notification
+        return self._fetch_notifications_page(club_slug, notifications_per_page, page_number) or []
+
+    @check_expired_token
+    def _fetch_notifications_page(self, club_slug: str, notifications_per_page: int = 99999,
+                                  page_number: int = 1) -> Optional[List[models.Notification]]:
+        """Retrieve a page of Notifications from a club, or None if the request failed."""
+        url = self.replace(self._notifications_url, club_slug=club_slug, feed_amount=notifications_per_page,
+                           page_number=page_number)
+        # notifications are polled for, so they are only sent again if they changed.
+        notifications = self._get_items(url, models.Notification, revalidate=True)
+        self._store(notifications)
         return notifications
 
     @check_expired_token
+    def fetch_notifications_many(self, club_slugs: List[str], notifications_per_page: int = 99999,
+                                 page_number: int = 1) -> Dict[str, List[models.Notification]]:
+        """
+        Retrieve the Notifications of several clubs at once.
+
+        The requests are sent from a few threads at a time instead of one after another.
+
+        Parameters
+        ----------
+        club_slugs: List[str]
+            The slugs (unique identifiers) of the clubs to search the notifications for.
+        notifications_per_page: int
+            The amount of notifications to retrieve per page for each club.
+        page_number: int
+            The page number when paginating.
+
+        Returns
+        -------
+        The Notifications of each club by club slug.: Dict[str, List[:class:`models.Notification`]]
+        """
+        if not club_slugs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_THREADS, len(club_slugs))) as executor:
+            results = executor.map(lambda club_slug: self.fetch_club_notifications(
+                club_slug, notifications_per_page, page_number), club_slugs)
+            return dict(zip(club_slugs, results))
+
     def fetch_post_comments(self, post_slug: str, comments_per_page: int = 99999,
                             page_number: int = 1) -> List[models.Comment]:
         """
@@ -280,20 +570,16 @@ class UCubeClientSync(UCubeClient):
         -------
         A list of Comments: List[:class:`models.Comment`]
         """
-        comments = []
-        replace_kwargs = {
-            "{post_slug}": post_slug,
-            "{feed_amount}": str(comments_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._comments_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status_code, url):
-                data = json.loads(resp.text)
-                for raw_comment in data.get("items"):
-                    comment = create_comment(raw_comment)
-                    comments.append(comment)
-                    self.comments[comment.slug] = comment
+        return self._fetch_comments_page(post_slug, comments_per_page, page_number) or []
+
+    @check_expired_token
+    def _fetch_comments_page(self, post_slug: str, comments_per_page: int = 99999,
+                             page_number: int = 1) -> Optional[List[models.Comment]]:
+        """Retrieve a page of Comments from a Post, or None if the request failed."""
+        url = self.replace(self._comments_url, post_slug=post_slug, feed_amount=comments_per_page,
+                           page_number=page_number)
+        comments = self._get_items(url, create_comment)
+        self._store(comments)
         return comments
 
     @check_expired_token
@@ -313,13 +599,10 @@ class UCubeClientSync(UCubeClient):
         The Post Object if there is one.: :class:`models.Post`
 
         """
-        replace_kwargs = {
-            "{post_slug}": post_slug
-        }
-        url = self.replace(self._single_post_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
+        url = self.replace(self._single_post_url, post_slug=post_slug)
+        with self.web_session.get(url=url, headers=self._request_headers) as resp:
             if self._check_status(resp.status_code, url):
-                raw_post = json.loads(resp.text)
+                raw_post = json_loads(resp.content)
                 post = create_post(raw_post)
                 if load_comments:
                     post.comments = self.fetch_post_comments(post.slug)
@@ -327,7 +610,6 @@ class UCubeClientSync(UCubeClient):
                 return post
         return
 
-    @check_expired_token
     def fetch_all_clubs(self, clubs_per_page: int = 99999, page_number: int = 1) -> List[models.Club]:
         """
         Fetch all Clubs from the UCube API.
@@ -336,20 +618,14 @@ class UCubeClientSync(UCubeClient):
         -------
         A list of Clubs: List[:class:`models.Club`]
         """
-        clubs = []
+        return self._fetch_clubs_page(clubs_per_page, page_number) or []
 
-        replace_kwargs = {
-            "{feed_amount}": str(clubs_per_page),
-            "{page_number}": str(page_number)
-        }
-        url = self.replace(self._all_clubs_url, **replace_kwargs)
-        with self.web_session.get(url=url, headers=self._headers) as resp:
-            if self._check_status(resp.status_code, url):
-                data = json.loads(resp.text)
-                for raw_club in data.get("items"):
-                    club = create_club(raw_club)
-                    clubs.append(club)
-                    self.clubs[club.slug] = club
+    @check_expired_token
+    def _fetch_clubs_page(self, clubs_per_page: int = 99999, page_number: int = 1) -> Optional[List[models.Club]]:
+        """Retrieve a page of Clubs, or None if the request failed."""
+        url = self.replace(self._all_clubs_url, feed_amount=clubs_per_page, page_number=page_number)
+        clubs = self._get_items(url, create_club)
+        self._store(clubs)
         return clubs
 
     @check_expired_token
@@ -367,18 +643,13 @@ class UCubeClientSync(UCubeClient):
         Whether following the Club was successful.: :class:`bool`
 
         """
-        replace_kwargs = {
-            "{club_slug}": club_slug,
-        }
         payload = {
-            "nick_name": ''.join(SystemRandom().choice(ascii_letters + digits) for _ in range(10))
+            # 10 random alphanumeric characters.
+            "nick_name": token_hex(5)
         }
-        url = self.replace(self._follow_club_url, **replace_kwargs)
-        headers = self._headers
-        with self.web_session.post(url=url, headers=headers, json=payload) as resp:
-            custom_error_message = {400: f"WARNING (NOT CRITICAL): Could not follow Club Slug: {club_slug} either due "
-                                         f"to a bad argument or they are already being followed."}
-            return self._check_status(resp.status_code, url, custom_error_message)
+        url = self.replace(self._follow_club_url, club_slug=club_slug)
+        with self.web_session.post(url=url, headers=self._request_headers, json=payload) as resp:
+            return self._check_status(resp.status_code, url, lambda: self._follow_error_messages(club_slug))
 
     @check_expired_token
     def check_new_notifications(self) -> List[models.Notification]:
@@ -393,17 +664,23 @@ class UCubeClientSync(UCubeClient):
         A list of new Notifications.: List[:class:`models.Notification`]
         """
         all_new_notifications = []
-        for club in self.clubs.values():
-            notifications = self.fetch_club_notifications(club.slug, notifications_per_page=15)
-            new_notifications = [notification for notification in notifications if notification not in
-                                 club.notifications]
-            all_new_notifications = all_new_notifications + new_notifications
-            club.notifications = club.notifications + new_notifications
-
-            for notification in new_notifications:
-                if notification.post_slug:
-                    # will add new Post to cache if it exists.
-                    self.fetch_post(notification.post_slug)
+        club_notifications = self.fetch_notifications_many(list(self.clubs), notifications_per_page=15)
+        for club_slug, notifications in club_notifications.items():
+            club = self.clubs.get(club_slug)
+            if not club or not notifications:
+                continue
+            existing_slugs = {notification.slug for notification in club.notifications}
+            new_notifications = [notification for notification in notifications if notification.slug not in
+                                 existing_slugs]
+            all_new_notifications.extend(new_notifications)
+            club.notifications.extend(new_notifications)
+
+        # will add the new Posts to cache if they exist.
+        post_slugs = [notification.post_slug for notification in all_new_notifications if notification.post_slug]
+        if post_slugs:
+            with ThreadPoolExecutor(max_workers=min(_MAX_THREADS, len(post_slugs))) as executor:
+                # the results are consumed so that an exception from any of the requests is raised here.
+                list(executor.map(self.fetch_post, post_slugs))
         return all_new_notifications
 
     def _start_loop_for_hook(self):
@@ -416,26 +693,46 @@ class UCubeClientSync(UCubeClient):
             raise NoHookFound
 
         self._hook_loop = True
+        self.__stop_event.clear()
+        poll_interval = _POLL_INTERVAL
         while self._hook_loop:
-            time.sleep(25)
+            if self.__stop_event.wait(poll_interval):
+                break
             new_notifications = self.check_new_notifications()
+            poll_interval = self._next_poll_interval(poll_interval, bool(new_notifications))
             if not new_notifications:
                 continue
 
             self._hook(new_notifications)
 
+    def stop(self):
+        """Stop the hook loop."""
+        super().stop()
+        self.__stop_event.set()
+
+    def _reinstate_token(self):
+        """
+        Get a working token again by refreshing it, or by logging in if there is no refresh token.
+
+        Only one thread will reinstate the token while any others wait for it.
+        """
+        with self.__token_lock:
+            # another thread may have already reinstated the token while this one waited.
+            if not self.expired_token:
+                return
+
+            if self._refresh_token_exists:
+                self._refresh_token()
+            else:
+                self._try_login()
+
     def _refresh_token(self):
         """
         Refresh a token while logged in.
         """
         payload = {"refresh_token": self._get_refresh_token()}
         with self.web_session.post(url=self._refresh_auth_url, json=payload) as resp:
-            data = json.loads(resp.text)
-            if self._check_status(resp.status_code, self._refresh_auth_url, message=data.get("message")):
-                token = data.get("token")
-                if token:
-                    self._set_token(token)
-                self.expired_token = False
+            if self._process_auth_response(resp.status_code, self._refresh_auth_url, resp.content):
                 return
         raise LoginFailed
 
@@ -445,8 +742,8 @@ class UCubeClientSync(UCubeClient):
 
         :returns: (:class:`bool`) True if the token works.
         """
-        with self.web_session.get(url=self._about_me_url, headers=self._headers) as resp:
+        with self.web_session.get(url=self._about_me_url, headers=self._request_headers) as resp:
             if resp.status_code == 200:
                 if not self._my_info_exists:
-                    self._set_my_info(json.loads(resp.text))
+                    self._set_my_info(json_loads(resp.content))
                 return True
@@ -1,13 +1,13 @@
 import asyncio
+from functools import lru_cache
 from typing import Optional, List
 
-from aiohttp import ClientSession
-
 import UCube
 import UCube.models
 from UCube import UCubeClientAsync
-from dotenv import load_dotenv
+from UCube.ucubeasync import close_shared_session
 from os import getenv
+from types import MappingProxyType
 
 
 """
@@ -39,29 +39,46 @@ def get_formatted_time(seconds):
     Not related to UCube.
     :param seconds: Amount of seconds to convert.
     """
-    seconds = round(seconds)
+    # the seconds are rounded first so that the cached results are reused.
+    return _format_whole_seconds(round(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int):
+    """Turn a whole amount of seconds into days, hours, minutes, and seconds."""
     minute, sec = divmod(seconds, 60)
     hour, minute = divmod(minute, 60)
     day, hour = divmod(hour, 24)
 
-    return f"{f'{day}d ' if day else ''}" \
-           f"{f'{hour}h ' if hour else ''}" \
-           f"{f'{minute}m ' if minute else ''}" \
-           f"{f'{sec}s' if sec else ''}" \
-           f"{f'0s' if seconds < 1 else ''}"
+    parts = [f"{amount}{unit}" for amount, unit in ((day, "d"), (hour, "h"), (minute, "m"), (sec, "s")) if amount]
+    return " ".join(parts) if parts else "0s"
+
+
+@lru_cache(maxsize=1)
+def get_env() -> MappingProxyType:
+    """Load the .env vars once and get the ones used by the example.
+
+    Not related to UCube.
+    """
+    # dotenv is only imported when the example actually runs.
+    from dotenv import load_dotenv
+    load_dotenv()  # load the .env vars -- Important.
+    return MappingProxyType({name: getenv(name) for name in ("UCUBE_USERNAME", "UCUBE_PASSWORD", "UCUBE_AUTH")})
 
 
 class Example:
     def __init__(self):
+        env = get_env()
         self.kwargs: dict = {
             # Only pass in the authorization method you plan to use
             # you can choose between passing in a username and password or by putting a token.
             # If you put both, it will prioritize username & password login and create tokens from that.
-            'username': getenv("UCUBE_USERNAME"),  # ucube username
-            'password': getenv("UCUBE_PASSWORD"),  # ucube password
-            'token': getenv("UCUBE_AUTH"),  # not suggested to pass in a token. This token will expire very quickly.
+            'username': env["UCUBE_USERNAME"],  # ucube username
+            'password': env["UCUBE_PASSWORD"],  # ucube password
+            'token': env["UCUBE_AUTH"],  # not suggested to pass in a token. This token will expire very quickly.
             # verbose will not go to a logger, but just print messages for more info. Should usually set to False.
             'verbose': True,
+            # without a web session, the client uses the shared session, which is closed once the example is done.
             'web_session': None,
             'hook': self.on_new_notifications  # SET THIS TO YOUR OWN METHOD TO RECEIVE NEW NOTIFICATIONS
 
@@ -75,9 +92,6 @@ class Example:
 
     async def start(self):
         if not self.ucube_client:
-            my_web_session = ClientSession()
-
-            self.kwargs["web_session"] = my_web_session
             self.ucube_client = UCubeClientAsync(**self.kwargs)
 
         # Create settings for how the history is created.
@@ -165,8 +179,21 @@ if __name__ == '__main__':
     print("||Starting Asynchronous Example||")
     print("=================================")
 
-    load_dotenv()  # load the .env vars -- Important.
+    try:
+        # uvloop is optional and not available on Windows, but makes the loop much faster at handling many requests.
+        # UCube will never change the event loop policy by itself, so it is up to the application to install it.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        ...
+
     example_object = Example()
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(example_object.start())
+    async def main():
+        try:
+            await example_object.start()
+        finally:
+            # the shared session has to be closed before asyncio.run closes the event loop.
+            await close_shared_session()
+
+    asyncio.run(main())
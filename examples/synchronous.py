@@ -1,10 +1,12 @@
-import requests.sessions
+import atexit
+from functools import lru_cache
 from typing import List
 
 import UCube
 from UCube import UCubeClientSync
-from dotenv import load_dotenv
+from UCube.ucubesync import get_shared_session, close_shared_session
 from os import getenv
+from types import MappingProxyType
 
 """
 synchronous.py
@@ -37,30 +39,48 @@ def get_formatted_time(seconds):
     Not related to UCube.
     :param seconds: Amount of seconds to convert.
     """
-    seconds = round(seconds)
+    # the seconds are rounded first so that the cached results are reused.
+    return _format_whole_seconds(round(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int):
+    """Turn a whole amount of seconds into days, hours, minutes, and seconds."""
     minute, sec = divmod(seconds, 60)
     hour, minute = divmod(minute, 60)
     day, hour = divmod(hour, 24)
 
-    return f"{f'{day}d ' if day else ''}" \
-           f"{f'{hour}h ' if hour else ''}" \
-           f"{f'{minute}m ' if minute else ''}" \
-           f"{f'{sec}s' if sec else ''}" \
-           f"{f'0s' if seconds < 1 else ''}"
+    parts = [f"{amount}{unit}" for amount, unit in ((day, "d"), (hour, "h"), (minute, "m"), (sec, "s")) if amount]
+    return " ".join(parts) if parts else "0s"
+
+
+@lru_cache(maxsize=1)
+def get_env() -> MappingProxyType:
+    """Load the .env vars once and get the ones used by the example.
+
+    Not related to UCube.
+    """
+    # dotenv is only imported when the example actually runs.
+    from dotenv import load_dotenv
+    load_dotenv()  # load the .env vars -- Important.
+    return MappingProxyType({name: getenv(name) for name in ("UCUBE_USERNAME", "UCUBE_PASSWORD", "UCUBE_AUTH")})
 
 
 class Example:
     def __init__(self):
+        env = get_env()
         kwargs = {
             # Only pass in the authorization method you plan to use
             # you can choose between passing in a username and password or by putting a token.
             # If you put both, it will prioritize username & password login and create tokens from that.
-            'username': getenv("UCUBE_USERNAME"),  # ucube username
-            'password': getenv("UCUBE_PASSWORD"),  # ucube password
-            'token': getenv("UCUBE_AUTH"),  # not suggested to pass in a token. This token will expire very quickly.
+            'username': env["UCUBE_USERNAME"],  # ucube username
+            'password': env["UCUBE_PASSWORD"],  # ucube password
+            'token': env["UCUBE_AUTH"],  # not suggested to pass in a token. This token will expire very quickly.
             # verbose will not go to a logger, but just print messages for more info. Should usually set to False.
             'verbose': True,
-            'web_session': requests.sessions.Session(),
+            # the shared session already has a connection pool sized for UCube and retries failed requests.
+            # if you pass in your own requests.Session, consider mounting an HTTPAdapter with a larger pool on it.
+            'web_session': get_shared_session(),
             'hook': self.on_new_notifications  # SET THIS TO YOUR OWN METHOD TO RECEIVE NEW NOTIFICATIONS
 
             # It is not necessary to use a hook as you can manually create the loop if you want. However, as it's not
@@ -72,8 +92,6 @@ class Example:
         self.ucube_client = UCubeClientSync(**kwargs)
 
     def start(self):
-        self.ucube_client.start()
-
         # Create settings for how the history is created.
         # This will create cache for the following:
         # This should be customized to YOUR Client.
@@ -152,6 +170,7 @@ if __name__ == '__main__':
     print("||Starting Synchronous Example||")
     print("================================")
 
-    load_dotenv()  # load the .env vars -- Important.
+    # the shared session is reused by every client, so it is closed once when the program exits.
+    atexit.register(close_shared_session)
     example_object = Example()
     example_object.start()
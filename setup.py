@@ -20,8 +20,11 @@ def parse_requirements(filename):
 setup(
     name='UCube',
     version=version,
-    packages=find_packages(),
+    packages=find_packages(include=["UCube", "UCube.*"]),
     install_requires=parse_requirements("requirements.txt"),
+    extras_require={
+        "speed": ["orjson", "ijson>=3.1"],
+    },
     url='https://github.com/MujyKun/united-cube/',
     license='MIT License',
     author='MujyKun',